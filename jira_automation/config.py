@@ -1,42 +1,104 @@
 """Configuration management for Jira automation."""
 
+import json
 import os
-import yaml
+import time
+from base64 import b64encode
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+def _setting(value: Optional[str], env_var: str) -> str:
+    """Return an explicitly passed setting, falling back to the environment."""
+    if value is None:
+        value = os.getenv(env_var, "")
+    return value.strip()
+
+
+# Parsed config files keyed by path, revalidated against (mtime_ns, size)
+_CONFIG_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+
+
 class Config:
     """Manages application configuration."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        jira_url: Optional[str] = None,
+        jira_email: Optional[str] = None,
+        jira_api_token: Optional[str] = None,
+        openai_api_key: Optional[str] = None,
+    ):
         self.config_dir = Path.home() / ".jira-automation"
-        self.config_file = self.config_dir / "config.yaml"
+        self.config_file = self.config_dir / "config.json"
+        self.legacy_config_file = self.config_dir / "config.yaml"
         self.config_dir.mkdir(exist_ok=True)
         
-        # Load environment variables
-        self.jira_url = os.getenv("JIRA_URL", "").strip()
-        self.jira_email = os.getenv("JIRA_EMAIL", "").strip()
-        self.jira_api_token = os.getenv("JIRA_API_TOKEN", "").strip()
-        self.openai_api_key = os.getenv("OPENAI_API_KEY", "").strip()
+        # Explicit arguments take precedence over environment variables
+        self.jira_url = _setting(jira_url, "JIRA_URL")
+        self.jira_email = _setting(jira_email, "JIRA_EMAIL")
+        self.jira_api_token = _setting(jira_api_token, "JIRA_API_TOKEN")
+        self.openai_api_key = _setting(openai_api_key, "OPENAI_API_KEY")
+        
+        # Epic Link field id discovered for jira_url ('' means none exists)
+        self.jira_epic_link_field_id: Optional[str] = None
+        self.jira_epic_link_cached_at = 0.0
         
         # Load persistent config
         self._load_config()
+        
+        # Precompute Jira auth headers once per config
+        self._auth_headers = self._build_auth_headers() if self.is_configured() else None
     
     def _load_config(self):
-        """Load persistent configuration from YAML file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config_data = yaml.safe_load(f) or {}
-                    jira_config = config_data.get('jira', {})
-                    self.jira_url = self.jira_url or jira_config.get('url', '')
-            except Exception:
-                pass
+        """Load persistent configuration from JSON file."""
+        try:
+            jira_config = self._read_config_data().get('jira', {})
+            self.jira_url = self.jira_url or jira_config.get('url', '')
+            if jira_config.get('epic_link_url') == self.jira_url:
+                self.jira_epic_link_field_id = jira_config.get('epic_link_field_id')
+                self.jira_epic_link_cached_at = jira_config.get('epic_link_cached_at', 0.0)
+        except Exception:
+            pass
+    
+    def _read_config_data(self) -> dict:
+        """Return the parsed config file, reusing the cached parse while it is unchanged."""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            if not self._migrate_legacy_config():
+                return {}
+            st = os.stat(self.config_file)
+
+        path = str(self.config_file)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        config_data = json.loads(self.config_file.read_bytes()) or {}
+        _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, config_data)
+        return config_data
+    
+    def _migrate_legacy_config(self) -> bool:
+        """Convert a legacy config.yaml into config.json. Returns True if migrated."""
+        try:
+            with open(self.legacy_config_file, 'r') as f:
+                # PyYAML is only needed for this one-time migration
+                import yaml
+                try:
+                    from yaml import CSafeLoader as Loader
+                except ImportError:  # PyYAML built without libyaml
+                    from yaml import SafeLoader as Loader
+                config_data = yaml.load(f, Loader=Loader) or {}
+            self.config_file.write_text(json.dumps(config_data))
+            self.legacy_config_file.unlink()
+            return True
+        except Exception:
+            return False
     
     def save_config(self, jira_url: str):
         """Save non-sensitive configuration."""
@@ -45,8 +107,24 @@ class Config:
                 'url': jira_url
             }
         }
-        with open(self.config_file, 'w') as f:
-            yaml.dump(config_data, f)
+        self.config_file.write_text(json.dumps(config_data))
+    
+    def save_epic_link_field_id(self, field_id: Optional[str]):
+        """Persist the Epic Link field id discovered for the current Jira URL."""
+        try:
+            config_data = dict(self._read_config_data())
+        except Exception:
+            config_data = {}
+        jira_config = dict(config_data.get('jira', {}))
+        self.jira_epic_link_field_id = field_id or ''
+        self.jira_epic_link_cached_at = time.time()
+        jira_config.update({
+            'epic_link_url': self.jira_url,
+            'epic_link_field_id': self.jira_epic_link_field_id,
+            'epic_link_cached_at': self.jira_epic_link_cached_at,
+        })
+        config_data['jira'] = jira_config
+        self.config_file.write_text(json.dumps(config_data))
     
     def save_env_file(self, jira_url: str, jira_email: str, jira_api_token: str, openai_api_key: str = None):
         """Save credentials to .env file in the project root."""
@@ -68,17 +146,35 @@ JIRA_API_TOKEN={jira_api_token}
     
     def is_configured(self) -> bool:
         """Check if basic configuration exists."""
-        return bool(self.jira_url and self.jira_email and self.jira_api_token)
+        return self._is_configured
     
     def is_llm_configured(self) -> bool:
         """Check if LLM configuration exists."""
+        return self._is_llm_configured
+    
+    def reset_checks(self):
+        """Forget cached configuration checks after credentials are changed in place."""
+        self.__dict__.pop('_is_configured', None)
+        self.__dict__.pop('_is_llm_configured', None)
+    
+    @cached_property
+    def _is_configured(self) -> bool:
+        return bool(self.jira_url and self.jira_email and self.jira_api_token)
+    
+    @cached_property
+    def _is_llm_configured(self) -> bool:
         return bool(self.openai_api_key)
     
     def get_auth_headers(self) -> dict:
         """Get authentication headers for Jira API."""
-        import base64
+        if self._auth_headers is None:
+            self._auth_headers = self._build_auth_headers()
+        return self._auth_headers
+    
+    def _build_auth_headers(self) -> dict:
+        """Build the Basic auth headers for the current Jira credentials."""
         credentials = f"{self.jira_email}:{self.jira_api_token}"
-        encoded = base64.b64encode(credentials.encode()).decode()
+        encoded = b64encode(credentials.encode()).decode()
         return {
             "Authorization": f"Basic {encoded}",
             "Accept": "application/json",
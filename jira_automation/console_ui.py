@@ -1,17 +1,30 @@
 """Interactive console UI for the application."""
 
-from typing import List, Dict, Optional
+import logging
+import sys
+from typing import Iterator, List, Dict, Optional
 from contextlib import contextmanager
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.text import Text
-from rich.markdown import Markdown
 from rich.status import Status
 
+logger = logging.getLogger(__name__)
+
 console = Console()
 
+# Static banner, built once instead of parsing Markdown on every start
+_WELCOME_PANEL = Panel(
+    Text.from_markup(
+        "[bold]Jira Brand and Bot Automation[/bold]\n\n"
+        "Convert your requirements into structured Jira tickets using AI."
+    ),
+    title="Welcome",
+    border_style="green",
+)
+
 
 class ConsoleUI:
     """Handles all console interactions."""
@@ -21,12 +34,7 @@ class ConsoleUI:
     
     def welcome(self):
         """Display welcome message."""
-        welcome_text = """
-# Jira Brand and Bot Automation
-
-Convert your requirements into structured Jira tickets using AI.
-"""
-        self.console.print(Panel(Markdown(welcome_text), title="Welcome", border_style="green"))
+        self.console.print(_WELCOME_PANEL)
     
     def get_initial_config(self) -> Dict[str, str]:
         """Get initial configuration from user."""
@@ -87,58 +95,56 @@ Convert your requirements into structured Jira tickets using AI.
     
     def get_requirements(self) -> str:
         """Get requirements input from user."""
-        import sys
-        print("\n[VERBOSE] Entering get_requirements()", flush=True)
+        logger.debug("Entering get_requirements()")
         
         self.console.print("\n[bold cyan]Enter Requirements[/bold cyan]")
         self.console.print("Enter your requirements (press Enter twice or type /done to finish):\n")
         sys.stdout.flush()
-        print("[VERBOSE] Prompt displayed, waiting for input...", flush=True)
         
         lines = []
         empty_lines = 0
-        line_count = 0
         
-        while True:
-            try:
-                print(f"[VERBOSE] Waiting for input (line {line_count + 1}, empty_lines={empty_lines})...", flush=True)
-                line = input()
-                line_count += 1
-                print(f"[VERBOSE] Received line {line_count}: '{line[:50]}...' (empty_lines={empty_lines})", flush=True)
-                
+        try:
+            for line in self._input_lines():
                 if line.strip().lower() == "/done":
-                    print("[VERBOSE] /done received, finishing input", flush=True)
+                    logger.debug("/done received, finishing input")
                     break
 
                 if not line.strip():
                     empty_lines += 1
-                    print(f"[VERBOSE] Empty line detected, count={empty_lines}", flush=True)
                     if empty_lines >= 2:
-                        print("[VERBOSE] Two empty lines detected, finishing input", flush=True)
+                        logger.debug("Two empty lines detected, finishing input")
                         break
                 else:
                     empty_lines = 0
                     lines.append(line)
-                    print(f"[VERBOSE] Added line to list, total lines={len(lines)}", flush=True)
-            except EOFError:
-                print("[VERBOSE] EOFError caught, breaking", flush=True)
-                break
-            except KeyboardInterrupt:
-                print("[VERBOSE] KeyboardInterrupt caught", flush=True)
-                self.console.print("\n[yellow]Input cancelled by user.[/yellow]")
-                sys.stdout.flush()
-                return ""
+        except KeyboardInterrupt:
+            logger.debug("KeyboardInterrupt caught")
+            self.console.print("\n[yellow]Input cancelled by user.[/yellow]")
+            return ""
         
         requirements = '\n'.join(lines)
-        print(f"[VERBOSE] Building requirements string, {len(lines)} lines, {len(requirements)} chars", flush=True)
         
         # Always print feedback immediately
-        print("", flush=True)  # New line
-        self.console.print(f"[green]✓ Requirements received ({len(lines)} lines, {len(requirements)} characters)[/green]")
-        sys.stdout.flush()
-        print(f"[VERBOSE] Returning from get_requirements(), length={len(requirements)}", flush=True)
+        self.console.print(f"\n[green]✓ Requirements received ({len(lines)} lines, {len(requirements)} characters)[/green]")
+        logger.debug("Returning from get_requirements(), length=%d", len(requirements))
         return requirements
     
+    def _input_lines(self) -> Iterator[str]:
+        """Yield input lines; piped stdin is read line by line without prompts."""
+        if not sys.stdin.isatty():
+            # Stop reading as soon as the caller stops, leaving later input for other prompts
+            for line in iter(sys.stdin.readline, ''):
+                yield line.rstrip('\r\n')
+            logger.debug("EOF received, finishing input")
+            return
+        while True:
+            try:
+                yield input()
+            except EOFError:
+                logger.debug("EOF received, finishing input")
+                return
+    
     @contextmanager
     def show_loading(self, message: str = "Processing..."):
         """Context manager to show loading spinner."""
@@ -1,17 +1,45 @@
 """Jira Cloud API client."""
 
 import logging
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from rich.console import Console
 
-logger = logging.getLogger(__name__)
-from rich.table import Table
-
 from .config import Config
 
+logger = logging.getLogger(__name__)
+
 console = Console()
 
+# How long a persisted Epic Link field id is trusted before re-fetching
+EPIC_LINK_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Shared by every blank description line; only ever serialized, never mutated
+_EMPTY_PARAGRAPH = {"type": "paragraph", "content": []}
+
+# Maximum number of issues Jira accepts per bulk create request
+BULK_CREATE_LIMIT = 50
+
+# Issue type spellings Jira Cloud expects as "Subtask"
+_SUBTASK_ALIASES = frozenset({'sub-task', 'sub task', 'subtask'})
+
+
+def _never_sent(error: requests.exceptions.RequestException) -> bool:
+    """Whether the request failed before a connection to Jira was established."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
 
 class JiraClient:
     """Client for interacting with Jira Cloud API v3."""
@@ -21,13 +49,28 @@ class JiraClient:
         self.base_url = config.jira_url.rstrip('/')
         self.headers = config.get_auth_headers()
         self._epic_link_field_id = None
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # Idempotent requests are retried on throttling/gateway errors;
+        # POSTs are not, so issue creation is never duplicated.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
     
     def test_connection(self) -> bool:
         """Test connection to Jira Cloud."""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/rest/api/3/myself",
-                headers=self.headers,
                 timeout=10
             )
             return response.status_code == 200
@@ -38,29 +81,33 @@ class JiraClient:
     def get_projects(self) -> List[Dict]:
         """Get list of available projects/boards."""
         try:
-            # Get projects
-            response = requests.get(
-                f"{self.base_url}/rest/api/3/project",
-                headers=self.headers,
-                timeout=10
-            )
+            # Fetch projects and boards concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                projects_future = executor.submit(
+                    self._session.get,
+                    f"{self.base_url}/rest/api/3/project",
+                    timeout=10
+                )
+                boards_future = executor.submit(
+                    self._session.get,
+                    f"{self.base_url}/rest/agile/1.0/board",
+                    timeout=10
+                )
+                response = projects_future.result()
+                boards_response = boards_future.result()
+            
             response.raise_for_status()
             projects = response.json()
             
-            # Get boards
-            boards_response = requests.get(
-                f"{self.base_url}/rest/agile/1.0/board",
-                headers=self.headers,
-                timeout=10
-            )
             boards = []
             if boards_response.status_code == 200:
                 boards = boards_response.json().get('values', [])
             
-            # Combine and format
-            result = []
+            # Combine and format, keyed by project key so that project
+            # entries win over boards pointing at the same project
+            result: Dict[str, Dict] = {}
             for project in projects:
-                result.append({
+                result.setdefault(project['key'], {
                     'key': project['key'],
                     'name': project['name'],
                     'id': project['id'],
@@ -69,29 +116,23 @@ class JiraClient:
             
             for board in boards:
                 project_key = board.get('location', {}).get('projectKey', '')
-                if project_key:
-                    result.append({
+                if project_key and project_key not in result:
+                    result[project_key] = {
                         'key': project_key,
                         'name': f"{board['name']} (Board)",
                         'id': board['id'],
                         'type': 'board'
-                    })
-            
-            # Remove duplicates by key
-            seen = set()
-            unique_result = []
-            for item in result:
-                if item['key'] not in seen:
-                    seen.add(item['key'])
-                    unique_result.append(item)
+                    }
             
-            return unique_result
+            return list(result.values())
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error fetching projects: {e}[/red]")
             return []
     
     def display_projects(self, projects: List[Dict]):
         """Display projects in a formatted table."""
+        from rich.table import Table
+
         table = Table(title="Available Projects/Boards")
         table.add_column("Key", style="cyan")
         table.add_column("Name", style="green")
@@ -109,9 +150,8 @@ class JiraClient:
     def get_account_id_by_email(self, email: str, project_key: str) -> Optional[str]:
         """Get Jira accountId for a user by email. Users are identified by accountId in Jira Cloud."""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/rest/api/3/user/assignable/search",
-                headers=self.headers,
                 params={"query": email.strip(), "project": project_key},
                 timeout=10,
             )
@@ -140,36 +180,19 @@ class JiraClient:
         assignee_account_id: Optional[str] = None,
     ) -> Optional[Dict]:
         """Create a Jira issue. Returns None on failure."""
-        normalized_type = self._normalize_issue_type(issue_type)
-
-        issue_data = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": summary,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": self._format_description(description),
-                },
-                "issuetype": {"name": normalized_type},
-            }
-        }
-
-        if assignee_account_id:
-            issue_data["fields"]["assignee"] = {"accountId": assignee_account_id}
-        if parent_key:
-            issue_data["fields"]["parent"] = {"key": parent_key}
-        if epic_key:
-            epic_link_field = self._get_epic_link_field_id()
-            if epic_link_field:
-                issue_data["fields"][epic_link_field] = epic_key
-            elif "parent" not in issue_data["fields"]:
-                issue_data["fields"]["parent"] = {"key": epic_key}
+        issue_data = self._build_issue_data(
+            project_key,
+            issue_type,
+            summary,
+            description,
+            parent_key=parent_key,
+            epic_key=epic_key,
+            assignee_account_id=assignee_account_id,
+        )
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/rest/api/3/issue",
-                headers=self.headers,
                 json=issue_data,
                 timeout=30,
             )
@@ -191,60 +214,185 @@ class JiraClient:
                 console.print(f"[red]Jira response: {err_body[:300]}[/red]")
             return None
     
+    def create_issues_bulk(self, issues: List[Dict], max_workers: int = 8) -> List[Optional[Dict]]:
+        """Create independent issues through the bulk endpoint.
+
+        Each entry holds create_issue keyword arguments. Entries must not depend on
+        each other, so create parents in an earlier call and pass their keys down.
+        Issues are sent BULK_CREATE_LIMIT at a time; if the bulk endpoint is
+        unavailable, the chunk is created with up to max_workers parallel requests.
+        Results are returned in input order, with None for failures.
+        """
+        results: List[Optional[Dict]] = []
+        for start in range(0, len(issues), BULK_CREATE_LIMIT):
+            chunk = issues[start:start + BULK_CREATE_LIMIT]
+            chunk_results = self._post_issue_bulk(chunk)
+            if chunk_results is None:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(chunk))) as executor:
+                    chunk_results = list(executor.map(lambda issue: self.create_issue(**issue), chunk))
+            results.extend(chunk_results)
+        return results
+
+    def _post_issue_bulk(self, issues: List[Dict]) -> Optional[List[Optional[Dict]]]:
+        """POST one bulk create request. Returns None if the endpoint could not be used."""
+        issue_updates = [self._build_issue_data(**issue) for issue in issues]
+        try:
+            response = self._session.post(
+                f"{self.base_url}/rest/api/3/issue/bulk",
+                json={"issueUpdates": issue_updates},
+                timeout=60,
+            )
+        except requests.exceptions.RequestException as e:
+            if _never_sent(e):
+                # Nothing reached Jira, so creating one by one cannot duplicate issues
+                logger.warning("Jira bulk create unavailable, creating issues one by one: %s", e)
+                return None
+            return self._bulk_failed(issues, e)
+
+        if response.status_code in (404, 405):
+            logger.warning(
+                "Jira bulk create endpoint not available (HTTP %s), creating issues one by one",
+                response.status_code,
+            )
+            return None
+        try:
+            # Jira answers 400 with per-issue errors when every issue failed
+            if response.status_code != 400:
+                response.raise_for_status()
+            body = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return self._bulk_failed(issues, e)
+
+        errors = body.get("errors") or []
+        if response.status_code == 400 and not errors:
+            logger.warning("Jira bulk create rejected: %s", response.text[:500])
+            return None
+
+        failed = {}
+        for error in errors:
+            element = error.get("failedElementNumber")
+            if element is not None:
+                failed[element] = error
+
+        # Created issues come back in request order, skipping the failed elements
+        created = iter(body.get("issues") or [])
+        results: List[Optional[Dict]] = []
+        for position, issue in enumerate(issues):
+            if position in failed:
+                element_errors = failed[position].get("elementErrors", {})
+                logger.error(
+                    "Jira bulk create failed for '%s': %s",
+                    issue["summary"],
+                    element_errors,
+                )
+                console.print(f"[red]Error creating issue '{issue['summary']}': {element_errors}[/red]")
+                results.append(None)
+            else:
+                results.append(next(created, None))
+        return results
+
+    def _bulk_failed(self, issues: List[Dict], error: Exception) -> List[None]:
+        """Report a bulk request whose outcome is unknown; issues may already exist."""
+        logger.error("Jira bulk create failed for %d issues: %s", len(issues), error)
+        console.print(f"[red]Error creating {len(issues)} issues: {error}[/red]")
+        return [None] * len(issues)
+
+    def _build_issue_data(
+        self,
+        project_key: str,
+        issue_type: str,
+        summary: str,
+        description: str,
+        parent_key: Optional[str] = None,
+        epic_key: Optional[str] = None,
+        assignee_account_id: Optional[str] = None,
+    ) -> Dict:
+        """Build the create payload for a single issue."""
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": summary,
+                "description": {
+                    "type": "doc",
+                    "version": 1,
+                    "content": self._format_description(description),
+                },
+                "issuetype": {"name": self._normalize_issue_type(issue_type)},
+            }
+        }
+
+        if assignee_account_id:
+            issue_data["fields"]["assignee"] = {"accountId": assignee_account_id}
+        if parent_key:
+            issue_data["fields"]["parent"] = {"key": parent_key}
+        if epic_key:
+            epic_link_field = self._get_epic_link_field_id()
+            if epic_link_field:
+                issue_data["fields"][epic_link_field] = epic_key
+            elif "parent" not in issue_data["fields"]:
+                issue_data["fields"]["parent"] = {"key": epic_key}
+        return issue_data
+
     def _normalize_issue_type(self, issue_type: str) -> str:
         """Normalize issue type names for Jira compatibility."""
-        type_mapping = {
-            'Sub-task': 'Subtask',
-            'Sub task': 'Subtask',
-            'subtask': 'Subtask',
-            'sub-task': 'Subtask'
-        }
-        return type_mapping.get(issue_type, issue_type)
+        return 'Subtask' if issue_type.lower() in _SUBTASK_ALIASES else issue_type
 
     def _get_epic_link_field_id(self) -> Optional[str]:
-        """Fetch and cache the Epic Link field id for company-managed projects."""
+        """Fetch and cache the Epic Link field id for company-managed projects.
+
+        The id is also persisted in the config file so later runs skip the
+        field listing until the cached value is older than a week.
+        """
         if self._epic_link_field_id is not None:
-            return self._epic_link_field_id
+            return self._epic_link_field_id or None
+
+        cached_id = self.config.jira_epic_link_field_id
+        if cached_id is not None and time.time() - self.config.jira_epic_link_cached_at < EPIC_LINK_CACHE_TTL:
+            self._epic_link_field_id = cached_id
+            return cached_id or None
 
         try:
-            response = requests.get(
-                f"{self.base_url}/rest/api/3/field",
-                headers=self.headers,
+            # Search only matching custom fields instead of listing every field
+            response = self._session.get(
+                f"{self.base_url}/rest/api/3/field/search",
+                params={"query": "epic link", "type": "custom", "maxResults": 10},
                 timeout=15
             )
-            response.raise_for_status()
-            fields = response.json()
+            if response.ok:
+                fields = response.json().get("values", [])
+            else:
+                # Field search needs admin rights; fall back to the full listing
+                response = self._session.get(
+                    f"{self.base_url}/rest/api/3/field",
+                    timeout=15
+                )
+                response.raise_for_status()
+                fields = response.json()
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error fetching Jira fields: {e}[/red]")
-            self._epic_link_field_id = None
             return None
 
+        # '' records that the instance has no Epic Link field
+        self._epic_link_field_id = ""
         for field in fields:
             if field.get("name", "").strip().lower() == "epic link":
-                self._epic_link_field_id = field.get("id")
-                return self._epic_link_field_id
+                self._epic_link_field_id = field.get("id") or ""
+                break
 
-        self._epic_link_field_id = None
-        return None
+        try:
+            self.config.save_epic_link_field_id(self._epic_link_field_id)
+        except OSError as e:
+            logger.warning("Could not persist Epic Link field id: %s", e)
+        return self._epic_link_field_id or None
     
     def _format_description(self, text: str) -> List[Dict]:
         """Format description text as Jira document format."""
-        lines = text.split('\n')
-        content = []
-        
-        for line in lines:
-            if line.strip():
-                content.append({
-                    "type": "paragraph",
-                    "content": [{
-                        "type": "text",
-                        "text": line
-                    }]
-                })
-            else:
-                content.append({"type": "paragraph", "content": []})
-        
-        return content if content else [{"type": "paragraph", "content": []}]
+        content = [
+            {"type": "paragraph", "content": [{"type": "text", "text": line}]}
+            if line.strip() else _EMPTY_PARAGRAPH
+            for line in text.split('\n')
+        ]
+        return content or [_EMPTY_PARAGRAPH]
     
     def get_issue_url(self, issue_key: str) -> str:
         """Get the URL for an issue."""
@@ -1,30 +1,26 @@
 """LLM integration for analyzing and structuring requirements."""
 
+import hashlib
+import logging
 from typing import List, Dict, Optional
-from openai import OpenAI
 from rich.console import Console
 import json
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    _json_loads = json.loads
+
 from .config import Config
 
+logger = logging.getLogger(__name__)
+
 console = Console()
 
+# Prompt text is static; only the per-call values are formatted in.
+_ANALYZE_SYSTEM = "You are an expert at analyzing software requirements and structuring them into Jira tickets. Always return valid JSON only."
 
-class LLMAnalyzer:
-    """Analyzes requirements using LLM and structures them into Jira tickets."""
-    
-    def __init__(self, config: Config):
-        self.config = config
-        if not config.openai_api_key:
-            raise ValueError("OpenAI API key not configured")
-        self.client = OpenAI(api_key=config.openai_api_key)
-    
-    def analyze_requirements(self, requirements: str) -> List[Dict]:
-        """Analyze requirements and generate ticket structure."""
-        import sys
-        print("[DEBUG] Preparing prompt for LLM...", flush=True)
-        
-        prompt = f"""Analyze the following requirements and generate a structured hierarchy of Jira tickets.
+_ANALYZE_TEMPLATE = """Analyze the following requirements and generate a structured hierarchy of Jira tickets.
 
 Requirements:
 {requirements}
@@ -53,49 +49,131 @@ Rules:
 
 Return ONLY valid JSON, no additional text."""
 
+# Changes whenever the requirements prompt does, so cached analyses can be invalidated
+PROMPT_VERSION = hashlib.sha256(
+    (_ANALYZE_SYSTEM + _ANALYZE_TEMPLATE).encode("utf-8")
+).hexdigest()[:12]
+
+_EMAIL_SYSTEM = "You are an assistant that extracts requests from emails to create Jira tasks. Respond only with valid JSON."
+
+_EMAIL_CONTEXT_TEMPLATE = """
+Client/recipient context (use this to better infer if the request is website-related):
+{context}
+"""
+
+_EMAIL_TEMPLATE = """Analyze the following email and extract the sender's request or inquiry.
+{context_block}
+---
+Email:
+Subject: {subject}
+From: {from_addr}
+
+Body:
+{body}
+
+Generate a JSON with this format:
+{{
+  "summary": "Short descriptive title of the request (max 80 chars)",
+  "description": "Detailed description including: what the sender is asking, relevant email context, and any important details",
+  "is_website_requirement": true or false
+}}
+
+Rules:
+1. summary must be concise and in English
+2. description must include the key information from the email
+3. If the email has no clear request, use a generic summary like "Email inquiry from [sender]" and use the body as description
+4. Set is_website_requirement to true when it is an actionable requirement related to the website/frontend. Use the client context above to decide: e.g. adding columns, new pages, frontend views, web UI changes, tables, dashboards, manuscript-related UI, etc. Set to false for general questions or consultations.
+5. Return ONLY valid JSON, no additional text."""
+
+_EMAIL_BATCH_TEMPLATE = """Analyze the following emails and extract each sender's request or inquiry.
+{context_block}
+---
+Emails (JSON array):
+{emails}
+
+Generate a JSON with this format:
+{{
+  "tasks": [
+    {{
+      "idx": idx of the email this task was extracted from,
+      "summary": "Short descriptive title of the request (max 80 chars)",
+      "description": "Detailed description including: what the sender is asking, relevant email context, and any important details",
+      "is_website_requirement": true or false
+    }}
+  ]
+}}
+
+Rules:
+1. Return exactly one task per email, echoing its idx
+2. summary must be concise and in English
+3. description must include the key information from the email
+4. If an email has no clear request, use a generic summary like "Email inquiry from [sender]" and use the body as description
+5. Set is_website_requirement to true when it is an actionable requirement related to the website/frontend. Use the client context above to decide: e.g. adding columns, new pages, frontend views, web UI changes, tables, dashboards, manuscript-related UI, etc. Set to false for general questions or consultations.
+6. Return ONLY valid JSON, no additional text."""
+
+
+class LLMAnalyzer:
+    """Analyzes requirements using LLM and structures them into Jira tickets."""
+    
+    def __init__(self, config: Config):
+        self.config = config
+        if not config.openai_api_key:
+            raise ValueError("OpenAI API key not configured")
+        # Imported here so that loading this module does not pull in the OpenAI SDK
+        from openai import OpenAI
+        self.client = OpenAI(api_key=config.openai_api_key)
+    
+    def analyze_requirements(self, requirements: str) -> List[Dict]:
+        """Analyze requirements and generate ticket structure."""
+        logger.debug("Preparing prompt for LLM...")
+        
+        prompt = _ANALYZE_TEMPLATE.format(requirements=requirements)
+
         try:
-            import sys
-            print("[DEBUG] Calling OpenAI API...", flush=True)
+            logger.debug("Calling OpenAI API...")
             
-            response = self.client.chat.completions.create(
+            # Stream the completion so chunks are collected while later tokens are in flight
+            stream = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are an expert at analyzing software requirements and structuring them into Jira tickets. Always return valid JSON only."},
+                    {"role": "system", "content": _ANALYZE_SYSTEM},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True
             )
             
-            print("[DEBUG] Received response from OpenAI, parsing...", flush=True)
+            parts = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+            content = "".join(parts)
             
-            print("[DEBUG] Checking response...", flush=True)
+            logger.debug("Received response from OpenAI in %d chunks, parsing...", len(parts))
             
-            if not response.choices or not response.choices[0].message.content:
-                print("[ERROR] Empty response from LLM", flush=True)
+            if not content:
+                logger.error("Empty response from LLM")
                 console.print("[red]Error: Empty response from LLM[/red]")
                 return []
             
-            content = response.choices[0].message.content
-            print(f"[DEBUG] Response content length: {len(content)}", flush=True)
-            print(f"[DEBUG] First 200 chars: {content[:200]}", flush=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response content length: %d", len(content))
+                logger.debug("First 200 chars: %s", content[:200])
             
-            print("[DEBUG] Parsing JSON...", flush=True)
-            result = json.loads(content)
-            print("[DEBUG] JSON parsed successfully", flush=True)
+            result = _json_loads(content)
             
             # Process and validate the structure
             tickets = result.get('tickets', [])
-            print(f"[DEBUG] Found {len(tickets)} tickets in response", flush=True)
+            logger.debug("Found %d tickets in response", len(tickets))
             
             if not tickets:
-                print("[WARNING] No tickets generated from requirements", flush=True)
+                logger.warning("No tickets generated from requirements")
                 console.print("[yellow]Warning: No tickets generated from requirements[/yellow]")
                 return []
             
-            print("[DEBUG] Processing tickets...", flush=True)
             processed = self._process_tickets(tickets)
-            print(f"[DEBUG] Processed {len(processed)} tickets", flush=True)
+            logger.debug("Processed %d tickets", len(processed))
             return processed
             
         except json.JSONDecodeError as e:
@@ -110,22 +188,17 @@ Return ONLY valid JSON, no additional text."""
             return []
     
     def _process_tickets(self, tickets: List[Dict]) -> List[Dict]:
-        """Process and validate ticket structure."""
-        processed = []
-        
+        """Process and validate ticket structure, filling defaults in place."""
         for idx, ticket in enumerate(tickets):
-            processed_ticket = {
-                'index': idx,
-                'type': ticket.get('type', 'Task'),
-                'summary': ticket.get('summary', 'Untitled'),
-                'description': ticket.get('description', ''),
-                'acceptance_criteria': ticket.get('acceptance_criteria', []),
-                'parent_index': ticket.get('parent_index'),
-                'key': None  # Will be set after creation
-            }
-            processed.append(processed_ticket)
+            ticket['index'] = idx
+            ticket.setdefault('type', 'Task')
+            ticket.setdefault('summary', 'Untitled')
+            ticket.setdefault('description', '')
+            ticket.setdefault('acceptance_criteria', [])
+            ticket.setdefault('parent_index', None)
+            ticket['key'] = None  # Will be set after creation
         
-        return processed
+        return tickets
 
     def extract_task_from_email(
         self, subject: str, from_addr: str, body: str, context: Optional[str] = None
@@ -135,36 +208,11 @@ Return ONLY valid JSON, no additional text."""
         Identifies what the sender is asking or requesting.
         context: Optional markdown with client/recipient context to improve is_website_requirement inference.
         """
-        context_block = ""
-        if context and context.strip():
-            context_block = f"""
-Client/recipient context (use this to better infer if the request is website-related):
-{context.strip()}
-"""
+        context_block = self._email_context_block(context)
 
-        prompt = f"""Analyze the following email and extract the sender's request or inquiry.
-{context_block}
----
-Email:
-Subject: {subject}
-From: {from_addr}
-
-Body:
-{body[:4000]}
-
-Generate a JSON with this format:
-{{
-  "summary": "Short descriptive title of the request (max 80 chars)",
-  "description": "Detailed description including: what the sender is asking, relevant email context, and any important details",
-  "is_website_requirement": true or false
-}}
-
-Rules:
-1. summary must be concise and in English
-2. description must include the key information from the email
-3. If the email has no clear request, use a generic summary like "Email inquiry from [sender]" and use the body as description
-4. Set is_website_requirement to true when it is an actionable requirement related to the website/frontend. Use the client context above to decide: e.g. adding columns, new pages, frontend views, web UI changes, tables, dashboards, manuscript-related UI, etc. Set to false for general questions or consultations.
-5. Return ONLY valid JSON, no additional text."""
+        prompt = _EMAIL_TEMPLATE.format(
+            context_block=context_block, subject=subject, from_addr=from_addr, body=body[:4000]
+        )
 
         try:
             response = self.client.chat.completions.create(
@@ -172,7 +220,7 @@ Rules:
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an assistant that extracts requests from emails to create Jira tasks. Respond only with valid JSON.",
+                        "content": _EMAIL_SYSTEM,
                     },
                     {"role": "user", "content": prompt},
                 ],
@@ -184,18 +232,80 @@ Rules:
                 return None
 
             content = response.choices[0].message.content
-            result = json.loads(content)
-            summary = result.get("summary", "Email inquiry")
-            description = result.get("description", body[:2000] if body else "")
-            is_website = result.get("is_website_requirement", False)
-            if isinstance(is_website, str):
-                is_website = is_website.lower() in ("true", "yes", "1")
-            return {
-                "summary": summary[:255],
-                "description": description,
-                "is_website_requirement": bool(is_website),
-            }
+            return self._email_task_from_result(_json_loads(content), body)
         except (json.JSONDecodeError, Exception) as e:
             console.print(f"[red]Error extracting task from email: {e}[/red]")
             return None
 
+    def extract_tasks_from_emails(
+        self, emails: List[Dict], context: Optional[str] = None, batch_size: int = 20
+    ) -> List[Optional[Dict]]:
+        """
+        Extract one Jira task per email, sending up to batch_size emails per LLM request.
+        emails: dicts with "subject", "from" and "body" (plain text) keys.
+        Returns a list aligned with emails; entries are None where extraction failed.
+        """
+        context_block = self._email_context_block(context)
+        tasks: List[Optional[Dict]] = [None] * len(emails)
+
+        for start in range(0, len(emails), batch_size):
+            batch = [
+                {
+                    "idx": idx,
+                    "subject": email.get("subject") or "",
+                    "from": email.get("from") or "",
+                    "body": (email.get("body") or "")[:4000],
+                }
+                for idx, email in enumerate(emails[start:start + batch_size], start)
+            ]
+
+            prompt = _EMAIL_BATCH_TEMPLATE.format(
+                context_block=context_block, emails=json.dumps(batch, ensure_ascii=False)
+            )
+
+            try:
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": _EMAIL_SYSTEM,
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    response_format={"type": "json_object"},
+                )
+
+                if not response.choices or not response.choices[0].message.content:
+                    continue
+
+                result = _json_loads(response.choices[0].message.content)
+                for item in result.get("tasks", []):
+                    idx = item.get("idx")
+                    if isinstance(idx, int) and start <= idx < start + len(batch):
+                        tasks[idx] = self._email_task_from_result(item, emails[idx].get("body") or "")
+            except (json.JSONDecodeError, Exception) as e:
+                console.print(f"[red]Error extracting tasks from emails: {e}[/red]")
+
+        return tasks
+
+    def _email_context_block(self, context: Optional[str]) -> str:
+        """Format optional client/recipient context for the email prompts."""
+        if not context or not context.strip():
+            return ""
+        return _EMAIL_CONTEXT_TEMPLATE.format(context=context.strip())
+
+    def _email_task_from_result(self, result: Dict, body: str) -> Dict:
+        """Normalize one LLM email extraction into a task dict."""
+        summary = result.get("summary", "Email inquiry")
+        description = result.get("description", body[:2000] if body else "")
+        is_website = result.get("is_website_requirement", False)
+        if isinstance(is_website, str):
+            is_website = is_website.lower() in ("true", "yes", "1")
+        return {
+            "summary": summary[:255],
+            "description": description,
+            "is_website_requirement": bool(is_website),
+        }
+
@@ -1,16 +1,22 @@
 """Main application entry point."""
 
+import argparse
+import logging
 import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
+from dotenv import load_dotenv, set_key
 from rich.console import Console
+from rich.logging import RichHandler
 
 from .config import Config
 from .jira_client import JiraClient
 from .llm_analyzer import LLMAnalyzer
 from .console_ui import ConsoleUI
 
+logger = logging.getLogger(__name__)
+
 console = Console()
 
 
@@ -22,6 +28,8 @@ class JiraAutomationApp:
         self.ui = ConsoleUI()
         self.jira_client = None
         self.llm_analyzer = None
+        # Max Jira issues created in parallel; 1 keeps creation sequential
+        self.concurrency = 1
     
     def setup_configuration(self):
         """Handle initial configuration."""
@@ -48,7 +56,6 @@ class JiraAutomationApp:
             self.ui.console.print("[green]Configuration saved to .env file[/green]")
             
             # Reload config
-            from dotenv import load_dotenv
             load_dotenv(override=True)
             self.config = Config()
         
@@ -58,19 +65,7 @@ class JiraAutomationApp:
             # Update .env file
             env_file = Path.cwd() / ".env"
             if env_file.exists():
-                lines = []
-                key_updated = False
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        if line.startswith('OPENAI_API_KEY='):
-                            lines.append(f'OPENAI_API_KEY={api_key}\n')
-                            key_updated = True
-                        else:
-                            lines.append(line)
-                if not key_updated:
-                    lines.append(f'\nOPENAI_API_KEY={api_key}\n')
-                with open(env_file, 'w') as f:
-                    f.writelines(lines)
+                set_key(str(env_file), 'OPENAI_API_KEY', api_key, quote_mode='never')
             else:
                 # Create new .env file
                 self.config.save_env_file(
@@ -79,9 +74,9 @@ class JiraAutomationApp:
                     self.config.jira_api_token,
                     api_key
                 )
-            from dotenv import load_dotenv
-            load_dotenv(override=True)
-            self.config = Config()
+            os.environ['OPENAI_API_KEY'] = api_key
+            self.config.openai_api_key = api_key
+            self.config.reset_checks()
     
     def initialize_clients(self):
         """Initialize Jira and LLM clients."""
@@ -125,38 +120,34 @@ class JiraAutomationApp:
     
     def process_requirements(self, requirements: str) -> List[Dict]:
         """Process requirements using LLM."""
-        import sys
-        
         if not requirements.strip():
-            print("[ERROR] No requirements provided.", flush=True)
+            logger.error("No requirements provided.")
             return []
         
         # Verify LLM analyzer is initialized
         if not self.llm_analyzer:
-            print("[ERROR] LLM analyzer not initialized!", flush=True)
+            logger.error("LLM analyzer not initialized!")
             return []
         
         # Show clear message before processing
-        print("\n[INFO] 🤖 Analyzing requirements with AI...", flush=True)
-        print("[INFO] This may take 10-30 seconds. Please wait...", flush=True)
+        logger.info("🤖 Analyzing requirements with AI...")
+        logger.info("This may take 10-30 seconds. Please wait...")
         
         # Process requirements
         try:
-            print("[DEBUG] Calling LLM analyzer...", flush=True)
+            logger.debug("Calling LLM analyzer...")
             tickets = self.llm_analyzer.analyze_requirements(requirements)
-            print(f"[DEBUG] Received {len(tickets) if tickets else 0} tickets from analyzer", flush=True)
+            logger.debug("Received %d tickets from analyzer", len(tickets) if tickets else 0)
         except Exception as e:
-            print(f"\n[ERROR] Error during analysis: {e}", flush=True)
-            import traceback
-            print(f"[ERROR] Details: {str(e)}", flush=True)
-            print(f"[DEBUG] {traceback.format_exc()}", flush=True)
+            logger.error("Error during analysis: %s", e)
+            logger.debug("Analysis failed", exc_info=True)
             return []
         
         if not tickets:
-            print("[ERROR] Failed to generate ticket structure.", flush=True)
+            logger.error("Failed to generate ticket structure.")
             return []
         
-        print(f"[SUCCESS] ✓ Successfully generated {len(tickets)} tickets!\n", flush=True)
+        logger.info("✓ Successfully generated %d tickets!", len(tickets))
         return tickets
     
     def review_and_edit_tickets(self, tickets: List[Dict]) -> List[Dict]:
@@ -209,51 +200,92 @@ class JiraAutomationApp:
         # Create mapping from original index to ticket
         index_to_ticket = {ticket['index']: ticket for ticket in tickets}
         
+        # Normalize each type once ("Sub-task", "sub task" -> "subtask")
+        for ticket in tickets:
+            ticket['_type_norm'] = ticket.get('type', '').strip().lower().replace('-', '').replace(' ', '')
+        
         # Sort tickets: Epics first, then Stories/Tasks, then Subtasks
-        # Map common variations to standard types
-        type_order = {'Epic': 0, 'Story': 1, 'Task': 1, 'Subtask': 2, 'Sub-task': 2}
-        sorted_tickets = sorted(tickets, key=lambda t: (type_order.get(t['type'], 1), t['index']))
+        type_order = {'epic': 0, 'subtask': 2}
+        sorted_tickets = sorted(tickets, key=lambda t: (type_order.get(t['_type_norm'], 1), t['index']))
         
         # Map from original index to created ticket key
         index_to_key = {}
         
-        def is_subtask_type(issue_type: str) -> bool:
-            normalized = issue_type.strip().lower().replace("-", "").replace(" ", "")
-            return normalized == "subtask"
-
-        def find_parent_chain(start_index: int) -> List[int]:
-            chain = []
-            current = start_index
+        def find_ancestor(start_index: Optional[int], matches, cache: Dict[int, Optional[int]]) -> Optional[int]:
+            """First index on start_index's parent chain whose ticket matches, memoized per chain."""
+            path = []
             visited = set()
+            current = start_index
+            found = None
             while current is not None and current not in visited:
+                if current in cache:
+                    found = cache[current]
+                    break
                 visited.add(current)
-                chain.append(current)
-                parent = index_to_ticket.get(current, {}).get("parent_index")
-                current = parent
-            return chain
+                path.append(current)
+                current_ticket = index_to_ticket.get(current)
+                if current_ticket is None:
+                    break
+                if matches(current_ticket):
+                    found = current
+                    break
+                current = current_ticket.get("parent_index")
+            # Every index walked shares the same answer
+            for idx in path:
+                cache[idx] = found
+            return found
+
+        # Resolve ancestors once per index instead of re-walking chains per ticket
+        first_non_subtask_ancestor: Dict[int, Optional[int]] = {}
+        epic_ancestor: Dict[int, Optional[int]] = {}
+        for ticket in tickets:
+            find_ancestor(
+                ticket['index'],
+                lambda t: t['_type_norm'] != "subtask",
+                first_non_subtask_ancestor,
+            )
+            find_ancestor(
+                ticket['index'],
+                lambda t: t['_type_norm'] == "epic",
+                epic_ancestor,
+            )
 
-        def find_first_non_subtask_ancestor(start_index: int) -> Optional[int]:
-            for idx in find_parent_chain(start_index):
-                parent_ticket = index_to_ticket.get(idx)
-                if not parent_ticket:
-                    continue
-                if not is_subtask_type(parent_ticket.get("type", "")):
-                    return idx
-            return None
+        # Tickets resolved but not yet sent to Jira, as (ticket, create_issue kwargs)
+        pending: List[Tuple[Dict, Dict]] = []
+        pending_indexes = set()
 
-        def find_epic_ancestor(start_index: int) -> Optional[int]:
-            for idx in find_parent_chain(start_index):
-                parent_ticket = index_to_ticket.get(idx)
-                if not parent_ticket:
-                    continue
-                if parent_ticket.get("type", "").strip().lower() == "epic":
-                    return idx
-            return None
+        def flush_pending():
+            if not pending:
+                return
+            payloads = [payload for _, payload in pending]
+            if self.concurrency > 1 and len(payloads) > 1:
+                results = self.jira_client.create_issues_bulk(payloads, max_workers=self.concurrency)
+            else:
+                results = [self.jira_client.create_issue(**payload) for payload in payloads]
 
-        # Create tickets in order
-        for ticket in sorted_tickets:
+            for (ticket, _), result in zip(pending, results):
+                if result:
+                    issue_key = result['key']
+                    # Store mapping from original index to created key
+                    index_to_key[ticket['index']] = issue_key
+                    created_tickets.append({
+                        'key': issue_key,
+                        'type': ticket['type'],
+                        'summary': ticket['summary'],
+                        'url': self.jira_client.get_issue_url(issue_key),
+                        'original_index': ticket['index']
+                    })
+                    ticket['key'] = issue_key
+                else:
+                    errors.append(f"Failed to create: {ticket['summary']}")
+            pending.clear()
+            pending_indexes.clear()
+
+        # Create tickets in order; with concurrency > 1, tickets are batched
+        # until one of them needs the key of a ticket still in the batch
+        for position, ticket in enumerate(sorted_tickets, 1):
             self.ui.display_creation_progress(
-                len(created_tickets) + 1,
+                position,
                 len(tickets),
                 ticket['summary']
             )
@@ -265,17 +297,20 @@ class JiraAutomationApp:
 
             parent_index = ticket.get("parent_index")
             if parent_index is not None:
-                non_subtask_parent_idx = find_first_non_subtask_ancestor(parent_index)
-                epic_parent_idx = find_epic_ancestor(parent_index)
+                non_subtask_parent_idx = first_non_subtask_ancestor.get(parent_index)
+                epic_parent_idx = epic_ancestor.get(parent_index)
+
+                # Ancestors must exist in Jira before their keys can be used
+                if non_subtask_parent_idx in pending_indexes or epic_parent_idx in pending_indexes:
+                    flush_pending()
 
-                if is_subtask_type(issue_type):
+                if ticket['_type_norm'] == "subtask":
                     if non_subtask_parent_idx is None:
                         errors.append(f"Skipped subtask (missing parent): {ticket['summary']}")
                         continue
 
                     parent_ticket = index_to_ticket.get(non_subtask_parent_idx)
-                    parent_type = parent_ticket.get("type", "").strip().lower()
-                    if parent_type == "epic":
+                    if parent_ticket['_type_norm'] == "epic":
                         issue_type = "Task"
                         epic_key = index_to_key.get(non_subtask_parent_idx)
                         if not epic_key:
@@ -294,34 +329,22 @@ class JiraAutomationApp:
             # Format description with acceptance criteria
             description = ticket.get('description', '')
             if ticket.get('acceptance_criteria'):
-                description += "\n\nAcceptance Criteria:\n"
-                for ac in ticket['acceptance_criteria']:
-                    description += f"• {ac}\n"
-            
-            # Create issue
-            result = self.jira_client.create_issue(
-                project_key=project_key,
-                issue_type=issue_type,
-                summary=ticket['summary'],
-                description=description,
-                parent_key=parent_key,
-                epic_key=epic_key
-            )
+                criteria = "".join(f"• {ac}\n" for ac in ticket['acceptance_criteria'])
+                description = f"{description}\n\nAcceptance Criteria:\n{criteria}"
             
-            if result:
-                issue_key = result['key']
-                # Store mapping from original index to created key
-                index_to_key[ticket['index']] = issue_key
-                created_tickets.append({
-                    'key': issue_key,
-                    'type': ticket['type'],
-                    'summary': ticket['summary'],
-                    'url': self.jira_client.get_issue_url(issue_key),
-                    'original_index': ticket['index']
-                })
-                ticket['key'] = issue_key
-            else:
-                errors.append(f"Failed to create: {ticket['summary']}")
+            pending.append((ticket, {
+                'project_key': project_key,
+                'issue_type': issue_type,
+                'summary': ticket['summary'],
+                'description': description,
+                'parent_key': parent_key,
+                'epic_key': epic_key,
+            }))
+            pending_indexes.add(ticket['index'])
+            if self.concurrency <= 1:
+                flush_pending()
+
+        flush_pending()
         
         return created_tickets, errors
     
@@ -340,44 +363,35 @@ class JiraAutomationApp:
         self.ui.console.print(f"\n[green]Selected project: {project_key}[/green]\n")
         
         # Get requirements
-        import sys
-        print("\n[VERBOSE] About to call get_requirements()", flush=True)
-        print("", end="", flush=True)  # Ensure newline
-        
+        logger.debug("About to call get_requirements()")
         requirements = self.ui.get_requirements()
-        print("[VERBOSE] Returned from get_requirements()", flush=True)
-        print("", flush=True)  # Force flush
-        
-        print(f"[VERBOSE] Requirements length: {len(requirements)}, stripped: {len(requirements.strip())}", flush=True)
+        logger.debug(
+            "Requirements length: %d, stripped: %d",
+            len(requirements),
+            len(requirements.strip()),
+        )
         
         if not requirements.strip():
-            print("\n[ERROR] No requirements provided. Exiting.", flush=True)
+            logger.error("No requirements provided. Exiting.")
             sys.exit(1)
         
-        # Show immediate feedback using print for reliability
+        # Show immediate feedback
         word_count = len(requirements.split())
         char_count = len(requirements)
-        print(f"\n[INFO] Processing: {word_count} words, {char_count} characters", flush=True)
+        logger.info("Processing: %d words, %d characters", word_count, char_count)
         
         # Process requirements
-        print("[VERBOSE] About to call process_requirements()", flush=True)
-        print("[INFO] Starting AI analysis...", flush=True)
+        logger.info("Starting AI analysis...")
         tickets = self.process_requirements(requirements)
-        print("[VERBOSE] Returned from process_requirements()", flush=True)
-        print("", flush=True)  # Force flush after processing
-        
-        print(f"[VERBOSE] Tickets returned: {len(tickets) if tickets else 0}", flush=True)
+        logger.debug("Tickets returned: %d", len(tickets) if tickets else 0)
         
         if not tickets:
-            print("[ERROR] No tickets generated. Exiting.", flush=True)
             self.ui.console.print("[red]No tickets generated. Exiting.[/red]")
             sys.exit(1)
         
-        print(f"[VERBOSE] About to call review_and_edit_tickets() with {len(tickets)} tickets", flush=True)
-        
         # Review and edit
         tickets = self.review_and_edit_tickets(tickets)
-        print(f"[VERBOSE] Returned from review_and_edit_tickets() with {len(tickets)} tickets", flush=True)
+        logger.debug("Reviewed %d tickets", len(tickets))
         
         # Confirm creation
         if not self.ui.confirm_creation():
@@ -393,7 +407,30 @@ class JiraAutomationApp:
 
 def main():
     """Entry point."""
+    parser = argparse.ArgumentParser(description="Convert requirements into Jira tickets using AI.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="maximum number of Jira issues to create in parallel (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="show debug output",
+    )
+    args = parser.parse_args()
+
+    # Only this package's loggers follow --verbose; third-party INFO chatter stays hidden
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, markup=True, show_path=False)],
+    )
+    logging.getLogger("jira_automation").setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
     app = JiraAutomationApp()
+    app.concurrency = max(1, args.concurrency)
     app.run()
 
 
@@ -5,13 +5,16 @@ Deploy to Render or similar cloud platforms.
 """
 
 import os
+import hmac
 import logging
 from pathlib import Path
 from contextlib import asynccontextmanager
+from typing import Dict, Optional, Union
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from jira_automation.config import Config
 from jira_automation.jira_client import JiraClient
@@ -28,6 +31,7 @@ logger = logging.getLogger(__name__)
 
 # --- Config ---
 WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "").strip()
+WEBHOOK_SECRET_BYTES = WEBHOOK_SECRET.encode()
 JIRA_EMAIL_PROJECT_KEY = os.getenv("JIRA_EMAIL_PROJECT_KEY", "").strip()
 JIRA_WEBSITE_ASSIGNEE_EMAIL = os.getenv("JIRA_WEBSITE_ASSIGNEE_EMAIL", "").strip()
 EMAIL_LLM_CONTEXT_PATH = os.getenv("EMAIL_LLM_CONTEXT_PATH", "email_llm_context.md").strip()
@@ -37,6 +41,12 @@ EMAIL_LLM_CONTEXT_PATH = os.getenv("EMAIL_LLM_CONTEXT_PATH", "email_llm_context.
 async def lifespan(app: FastAPI):
     """Startup/shutdown lifespan."""
     logger.info("Starting Jira automation API server")
+    # Clients are built once per process and shared by every request
+    config = Config()
+    app.state.config = config
+    app.state.llm = LLMAnalyzer(config) if config.is_llm_configured() else None
+    app.state.jira = JiraClient(config) if config.is_configured() else None
+    app.state.llm_context = load_llm_context()
     yield
     logger.info("Shutting down")
 
@@ -49,9 +59,84 @@ app = FastAPI(
 )
 
 
+# --- Models ---
+
+
+class EmailBody(BaseModel):
+    """Plain-text and HTML parts of an email."""
+
+    plain: str = ""
+    html: str = ""
+
+    @field_validator("plain", "html", mode="before")
+    @classmethod
+    def _as_text(cls, value):
+        return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+class EmailPayload(BaseModel):
+    """Email JSON posted by Google Apps Script."""
+
+    subject: str = ""
+    from_: str = Field("", alias="from")
+    body: Union[EmailBody, str] = Field(default_factory=EmailBody)
+    message_id: Optional[str] = None
+
+    @field_validator("subject", "from_", mode="before")
+    @classmethod
+    def _as_text(cls, value):
+        return str(value) if value else ""
+
+    @field_validator("message_id", mode="before")
+    @classmethod
+    def _as_optional_text(cls, value):
+        return str(value) if value else None
+
+    @field_validator("body", mode="before")
+    @classmethod
+    def _coerce_body(cls, value):
+        # Anything other than a {plain, html} object with content is kept as raw text
+        if not value:
+            return {}
+        if isinstance(value, dict) and (value.get("plain") or value.get("html")):
+            return value
+        return str(value)[:5000]
+
+    @property
+    def body_text(self) -> str:
+        if isinstance(self.body, EmailBody):
+            return (self.body.plain or self.body.html).strip()
+        return self.body.strip()
+
+
+class WebhookEmailResponse(BaseModel):
+    """Response body for /webhook/email."""
+
+    ok: bool = True
+    jira_key: Optional[str] = None
+    jira_url: str = ""
+    summary: str
+
+
 # --- Helpers ---
 
 
+def load_llm_context() -> str:
+    """Read the optional email LLM context file from the working or server directory."""
+    for base in (Path.cwd(), Path(__file__).resolve().parent):
+        ctx_path = base / EMAIL_LLM_CONTEXT_PATH
+        if not ctx_path.is_file():
+            continue
+        try:
+            llm_context = ctx_path.read_text(encoding="utf-8")
+            logger.info("Loaded email LLM context from %s", ctx_path)
+            return llm_context
+        except Exception as e:
+            logger.warning("Could not read %s: %s", ctx_path, e)
+            return ""
+    return ""
+
+
 def verify_webhook_secret(request: Request) -> None:
     """Verify X-Webhook-Secret header."""
     if not WEBHOOK_SECRET:
@@ -59,53 +144,46 @@ def verify_webhook_secret(request: Request) -> None:
         return
 
     secret = request.headers.get("X-Webhook-Secret", "")
-    if secret != WEBHOOK_SECRET:
+    if not hmac.compare_digest(secret.encode(), WEBHOOK_SECRET_BYTES):
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
 
 @app.get("/")
-async def root():
+async def root() -> Dict[str, str]:
     """Health check / root."""
     return {"status": "ok", "service": "jira-automation-api"}
 
 
 @app.get("/health")
-async def health():
+async def health() -> Dict[str, str]:
     """Health check for Render and load balancers."""
     return {"status": "healthy"}
 
 
 @app.post("/webhook/email")
-async def webhook_email(request: Request):
+async def webhook_email(request: Request) -> WebhookEmailResponse:
     """
     Receive email JSON from Google Apps Script.
     Analyzes content with LLM and creates a Jira task automatically.
     """
     verify_webhook_secret(request)
 
+    # Validated after the secret check so unauthenticated requests are never parsed
     try:
-        payload = await request.json()
-    except Exception as e:
-        logger.error("Invalid JSON body: %s", e)
-        raise HTTPException(status_code=400, detail="Invalid JSON body")
+        payload = EmailPayload.model_validate_json(await request.body())
+    except ValidationError as e:
+        logger.error("Invalid email payload: %s", e)
+        raise HTTPException(status_code=400, detail="Invalid email payload")
 
-    # Parse payload
-    subject = payload.get("subject") or ""
-    from_addr = payload.get("from") or ""
-    body_obj = payload.get("body") or {}
-    body_plain = body_obj.get("plain") if isinstance(body_obj, dict) else ""
-    body_html = body_obj.get("html") if isinstance(body_obj, dict) else ""
-
-    if not body_plain and not body_html:
-        body_plain = str(body_obj)[:5000] if body_obj else ""
-
-    body_text = (body_plain or body_html or "").strip()
+    subject = payload.subject
+    from_addr = payload.from_
+    body_text = payload.body_text
 
     if not body_text and not subject:
         raise HTTPException(status_code=400, detail="Email body and subject are empty")
 
     # Config check
-    config = Config()
+    config = request.app.state.config
     if not config.is_configured():
         logger.error("Jira not configured (JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN)")
         raise HTTPException(status_code=503, detail="Jira not configured")
@@ -118,22 +196,18 @@ async def webhook_email(request: Request):
         logger.error("JIRA_EMAIL_PROJECT_KEY not set")
         raise HTTPException(status_code=503, detail="JIRA_EMAIL_PROJECT_KEY not configured")
 
-    # Load optional client context for LLM (helps infer is_website_requirement)
-    llm_context = ""
-    for base in (Path.cwd(), Path(__file__).resolve().parent):
-        ctx_path = base / EMAIL_LLM_CONTEXT_PATH
-        if ctx_path.exists() and ctx_path.is_file():
-            try:
-                llm_context = ctx_path.read_text(encoding="utf-8")
-                logger.info("Loaded email LLM context from %s", ctx_path)
-            except Exception as e:
-                logger.warning("Could not read %s: %s", ctx_path, e)
-            break
+    # Optional client context for LLM (helps infer is_website_requirement)
+    llm_context = request.app.state.llm_context
 
     # Extract task from email with LLM
-    llm = LLMAnalyzer(config)
-    task = llm.extract_task_from_email(
-        subject=subject, from_addr=from_addr, body=body_text, context=llm_context
+    # The OpenAI and Jira clients block, so they run in the threadpool to keep the event loop free
+    llm = request.app.state.llm
+    task = await run_in_threadpool(
+        llm.extract_task_from_email,
+        subject=subject,
+        from_addr=from_addr,
+        body=body_text,
+        context=llm_context,
     )
 
     if not task:
@@ -141,17 +215,18 @@ async def webhook_email(request: Request):
         raise HTTPException(status_code=500, detail="Failed to extract task from email")
 
     # Add email metadata to description
-    meta = f"---\n*Email from: {from_addr}*"
-    if payload.get("message_id"):
-        meta += f"\n*Message ID: {payload.get('message_id')}*"
-    full_description = f"{task['description']}\n\n{meta}"
+    parts = [task["description"], "", "---", f"*Email from: {from_addr}*"]
+    if payload.message_id:
+        parts.append(f"*Message ID: {payload.message_id}*")
+    full_description = "\n".join(parts)
+
+    jira = request.app.state.jira
 
     # Resolve assignee for website requirements
     assignee_account_id = None
     if task.get("is_website_requirement") and JIRA_WEBSITE_ASSIGNEE_EMAIL:
-        jira = JiraClient(config)
-        assignee_account_id = jira.get_account_id_by_email(
-            JIRA_WEBSITE_ASSIGNEE_EMAIL, JIRA_EMAIL_PROJECT_KEY
+        assignee_account_id = await run_in_threadpool(
+            jira.get_account_id_by_email, JIRA_WEBSITE_ASSIGNEE_EMAIL, JIRA_EMAIL_PROJECT_KEY
         )
         if assignee_account_id:
             logger.info("Assigning website task to %s", JIRA_WEBSITE_ASSIGNEE_EMAIL)
@@ -159,8 +234,8 @@ async def webhook_email(request: Request):
             logger.warning("Could not find Jira user for %s, creating unassigned", JIRA_WEBSITE_ASSIGNEE_EMAIL)
 
     # Create Jira issue
-    jira = JiraClient(config)
-    result = jira.create_issue(
+    result = await run_in_threadpool(
+        jira.create_issue,
         project_key=JIRA_EMAIL_PROJECT_KEY,
         issue_type="Task",
         summary=task["summary"],
@@ -182,12 +257,8 @@ async def webhook_email(request: Request):
 
     logger.info("Created Jira issue %s from email subject=%s", issue_key, subject[:50])
 
-    return JSONResponse(
-        status_code=200,
-        content={
-            "ok": True,
-            "jira_key": issue_key,
-            "jira_url": issue_url,
-            "summary": task["summary"],
-        },
+    return WebhookEmailResponse(
+        jira_key=issue_key,
+        jira_url=issue_url,
+        summary=task["summary"],
     )
@@ -1,12 +1,30 @@
 import os
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+import pandas as pd
 import streamlit as st
 
 from jira_automation.config import Config
 from jira_automation.jira_client import JiraClient
-from jira_automation.llm_analyzer import LLMAnalyzer
-from jira_automation.main import JiraAutomationApp
+
+if TYPE_CHECKING:
+    from jira_automation.main import JiraAutomationApp
+
+THEME_CSS_PATH = Path(__file__).resolve().parent / "assets" / "theme.css"
+
+# Tickets of the same hierarchy level are created together, up to this many requests at once
+CREATE_CONCURRENCY = 8
+
+# Ticket types offered in the editor
+_TYPES = ("Epic", "Story", "Task", "Subtask")
+
+# Badge class per normalized ticket type; anything else is styled as a task
+_PILL = {"epic": "pill-epic", "story": "pill-story", "subtask": "pill-subtask"}
+
+
+class _EmptyResult(Exception):
+    """Raised inside cached calls so that empty results are not cached."""
 
 
 class SilentUI:
@@ -14,149 +32,21 @@ class SilentUI:
         return
 
 
+_SILENT = SilentUI()
+
+
+@st.cache_data(show_spinner=False)
+def _css() -> str:
+    return THEME_CSS_PATH.read_text(encoding="utf-8")
+
+
 def apply_theme():
     st.set_page_config(
         page_title="Jira Automation Studio",
         layout="wide",
     )
-    st.markdown(
-        """
-        <style>
-        :root {
-            --bg: #0b0e12;
-            --surface: #12161b;
-            --surface-2: #151b22;
-            --ink: #f2f4f6;
-            --muted: #a8b0ba;
-            --accent: #5ce1d7;
-            --accent-2: #ff9f4a;
-            --card: #141a21;
-            --border: #232a33;
-            --glow: rgba(92, 225, 215, 0.18);
-            --epic: #6dd3ff;
-            --story: #b98bff;
-            --task: #ffd166;
-            --subtask: #9cffc7;
-        }
-        .stApp {
-            background: radial-gradient(1200px 800px at 15% -20%, #1f2834 0%, var(--bg) 55%, #0a0c0f 100%);
-            color: var(--ink);
-        }
-        header[data-testid="stHeader"] {
-            background: transparent;
-        }
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #0f1319 0%, #10151b 100%);
-            border-right: 1px solid var(--border);
-        }
-        section[data-testid="stSidebar"] * {
-            color: var(--ink);
-        }
-        .block-container {
-            padding-top: 2.5rem;
-            padding-bottom: 2rem;
-        }
-        h1, h2, h3, h4, h5, h6, p, label, span {
-            font-family: "Palatino Linotype", "Book Antiqua", "Georgia", serif;
-            color: var(--ink);
-        }
-        .hero {
-            background: linear-gradient(135deg, #1b2431 0%, #121820 100%);
-            border: 1px solid rgba(92, 225, 215, 0.25);
-            border-radius: 22px;
-            padding: 1.8rem 2.2rem;
-            box-shadow: 0 18px 40px rgba(0, 0, 0, 0.5);
-        }
-        .hero h1 {
-            font-size: 2.4rem;
-            margin-bottom: 0.3rem;
-        }
-        .hero p {
-            font-size: 1.02rem;
-            color: var(--muted);
-            margin-top: 0.2rem;
-        }
-        .stTextArea textarea, .stTextInput input, .stSelectbox select, .stNumberInput input {
-            background: var(--card) !important;
-            border: 1px solid var(--border) !important;
-            border-radius: 12px !important;
-            color: var(--ink) !important;
-        }
-        .stTextArea textarea:focus, .stTextInput input:focus {
-            border-color: var(--accent) !important;
-            box-shadow: 0 0 0 3px var(--glow) !important;
-        }
-        .stButton button {
-            background: linear-gradient(120deg, var(--accent), #4bb0a7);
-            border: 1px solid rgba(92, 225, 215, 0.6);
-            color: #081014;
-            border-radius: 12px;
-            padding: 0.5rem 1.1rem;
-            box-shadow: 0 10px 24px rgba(0, 0, 0, 0.3);
-        }
-        .stButton button:hover {
-            background: linear-gradient(120deg, #4fbeb5, #3ea39a);
-            border-color: rgba(92, 225, 215, 0.9);
-        }
-        .section-title {
-            font-size: 1.35rem;
-            margin: 0.4rem 0 0.6rem 0;
-            letter-spacing: 0.04em;
-        }
-        .card {
-            background: var(--card);
-            border: 1px solid var(--border);
-            border-radius: 16px;
-            padding: 1.1rem 1.4rem;
-            box-shadow: 0 14px 28px rgba(0, 0, 0, 0.4);
-        }
-        .ticket-pill {
-            display: inline-block;
-            padding: 0.25rem 0.7rem;
-            border-radius: 999px;
-            font-size: 0.72rem;
-            text-transform: uppercase;
-            letter-spacing: 0.12em;
-            margin-right: 0.6rem;
-            border: 1px solid transparent;
-        }
-        .pill-epic {
-            background: rgba(109, 211, 255, 0.12);
-            border-color: rgba(109, 211, 255, 0.5);
-            color: var(--epic);
-        }
-        .pill-story {
-            background: rgba(185, 139, 255, 0.12);
-            border-color: rgba(185, 139, 255, 0.5);
-            color: var(--story);
-        }
-        .pill-task {
-            background: rgba(255, 209, 102, 0.12);
-            border-color: rgba(255, 209, 102, 0.5);
-            color: var(--task);
-        }
-        .pill-subtask {
-            background: rgba(156, 255, 199, 0.12);
-            border-color: rgba(156, 255, 199, 0.5);
-            color: var(--subtask);
-        }
-        .subtle {
-            color: var(--muted);
-        }
-        .divider {
-            height: 1px;
-            background: var(--border);
-            margin: 1.2rem 0;
-        }
-        div[data-testid="stDataFrame"] {
-            border-radius: 14px;
-            overflow: hidden;
-            border: 1px solid var(--border);
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Base colors come from .streamlit/config.toml; the stylesheet adds the custom components
+    st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 
 def build_config_from_inputs(
@@ -166,63 +56,267 @@ def build_config_from_inputs(
     openai_api_key: str,
     persist: bool,
 ) -> Config:
-    os.environ["JIRA_URL"] = jira_url.strip()
-    os.environ["JIRA_EMAIL"] = jira_email.strip()
-    os.environ["JIRA_API_TOKEN"] = jira_api_token.strip()
-    os.environ["OPENAI_API_KEY"] = openai_api_key.strip()
-
-    config = Config()
+    jira_url = jira_url.strip()
+    jira_email = jira_email.strip()
+    jira_api_token = jira_api_token.strip()
+    openai_api_key = openai_api_key.strip()
+    os.environ.update({
+        "JIRA_URL": jira_url,
+        "JIRA_EMAIL": jira_email,
+        "JIRA_API_TOKEN": jira_api_token,
+        "OPENAI_API_KEY": openai_api_key,
+    })
+
+    config = Config(
+        jira_url=jira_url,
+        jira_email=jira_email,
+        jira_api_token=jira_api_token,
+        openai_api_key=openai_api_key,
+    )
     if persist:
         config.save_env_file(jira_url, jira_email, jira_api_token, openai_api_key)
     return config
 
 
-def describe_ticket(ticket: Dict, tickets: List[Dict]) -> str:
-    parent_summary = ""
-    parent_idx = ticket.get("parent_index")
-    if parent_idx is not None and 0 <= parent_idx < len(tickets):
-        parent_summary = tickets[parent_idx].get("summary", "")
-    if parent_summary:
-        return f"{ticket['type']} - {ticket['summary']} (Parent: {parent_summary})"
-    return f"{ticket['type']} - {ticket['summary']}"
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_jira_client(jira_url: str, jira_email: str, jira_api_token: str) -> JiraClient:
+    """Jira client shared across reruns and sessions for the same credentials."""
+    return JiraClient(
+        Config(jira_url=jira_url, jira_email=jira_email, jira_api_token=jira_api_token)
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _automation_app(jira_url: str, jira_email: str, jira_api_token: str) -> "JiraAutomationApp":
+    """Ticket-creation app bound to the shared Jira client for these credentials."""
+    # Deferred so that configuring credentials does not load the CLI and LLM modules
+    from jira_automation.main import JiraAutomationApp
 
+    app = JiraAutomationApp()
+    app.jira_client = get_jira_client(jira_url, jira_email, jira_api_token)
+    app.ui = _SILENT
+    app.concurrency = CREATE_CONCURRENCY
+    return app
 
-def build_parent_options(current_index: int, tickets: List[Dict]) -> List[Tuple[str, Optional[int]]]:
-    options = [("None", None)]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_projects(jira_url: str, jira_email: str, jira_api_token: str) -> List[Dict]:
+    """Project listing shared across sessions for five minutes."""
+    projects = get_jira_client(jira_url, jira_email, jira_api_token).get_projects()
+    if not projects:
+        raise _EmptyResult()
+    return projects
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=16,
+    hash_funcs={list: lambda projects: tuple((p["key"], p["name"]) for p in projects)},
+)
+def _project_options(projects: List[Dict]) -> Tuple[List[str], Dict[str, str]]:
+    """Project selectbox labels and the project key behind each label."""
+    labels = [f"{p['key']} - {p['name']}" for p in projects]
+    return labels, {label: p["key"] for label, p in zip(labels, projects)}
+
+
+# Persisted across restarts; prompt_version keys out results from older prompts.
+# Streamlit ignores ttl for disk-persisted caches, so the size is bounded instead.
+@st.cache_data(
+    persist="disk",
+    max_entries=256,
+    show_spinner=False,
+    hash_funcs={Config: lambda config: config.openai_api_key},
+)
+def _analyze(requirements: str, config: Config, prompt_version: str) -> List[Dict]:
+    """Analyze requirements, reusing the result for identical input, API key and prompt."""
+    from jira_automation.llm_analyzer import LLMAnalyzer
+
+    tickets = LLMAnalyzer(config).analyze_requirements(requirements)
+    if not tickets:
+        raise _EmptyResult()
+    return tickets
+
+
+def _parent_options(tickets: List[Dict]) -> Tuple[List[str], Dict[str, Optional[int]]]:
+    """Parent selectbox labels and the label-to-index mapping, in one pass."""
+    labels = ["None"]
+    mapping: Dict[str, Optional[int]] = {"None": None}
     for idx, t in enumerate(tickets):
-        if idx == current_index:
-            continue
         label = f"{idx + 1}. {t['type']} - {t['summary']}"
-        options.append((label, idx))
-    return options
+        labels.append(label)
+        mapping[label] = idx
+    return labels, mapping
 
 
 def tickets_table(tickets: List[Dict]) -> List[Dict]:
-    rows = []
-    for ticket in tickets:
-        parent = ""
+    summaries = [t.get("summary", "") for t in tickets]
+    n = len(tickets)
+    rows = [None] * n
+    for i, ticket in enumerate(tickets):
         parent_idx = ticket.get("parent_index")
-        if parent_idx is not None and 0 <= parent_idx < len(tickets):
-            parent = tickets[parent_idx].get("summary", "")
-        rows.append(
-            {
-                "Type": ticket.get("type"),
-                "Summary": ticket.get("summary"),
-                "Parent": parent,
-            }
-        )
+        rows[i] = {
+            "Type": ticket.get("type"),
+            "Summary": ticket.get("summary"),
+            "Parent": summaries[parent_idx] if parent_idx is not None and 0 <= parent_idx < n else "",
+        }
     return rows
 
 
+@st.cache_data(
+    show_spinner=False,
+    max_entries=64,
+    hash_funcs={list: lambda tickets: tuple(
+        (t.get("type"), t.get("summary"), t.get("parent_index")) for t in tickets
+    )},
+)
+def _tickets_df(tickets: List[Dict]) -> pd.DataFrame:
+    """Preview table as a DataFrame, rebuilt only when its columns change."""
+    return pd.DataFrame(tickets_table(tickets))
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=16,
+    hash_funcs={list: lambda created: tuple(tuple(t.items()) for t in created)},
+)
+def _created_df(created: List[Dict]) -> pd.DataFrame:
+    """Created tickets report as a DataFrame."""
+    return pd.DataFrame(created)
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=64,
+    hash_funcs={list: lambda tickets: tuple(
+        (t.get("type"), t.get("summary"), (t.get("description") or "")[:140]) for t in tickets
+    )},
+)
+def _preview_html(tickets: List[Dict]) -> str:
+    """Card markup for the ticket preview."""
+    return "".join(
+        f"<div class='card'><span class='ticket-pill {pill_class(ticket.get('type', ''))}'>"
+        f"{ticket.get('type')}</span><strong>{ticket.get('summary')}</strong>"
+        f"<div class='subtle'>{(ticket.get('description') or '')[:140]}</div></div>"
+        for ticket in tickets
+    )
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=64,
+    hash_funcs={list: lambda tickets: tuple(
+        (t.get("type"), t.get("summary"), t.get("description"), t.get("parent_index")) for t in tickets
+    )},
+)
+def _editor_df(tickets: List[Dict]) -> pd.DataFrame:
+    """Editable columns, with parents shown as the labels offered by the Parent selectbox."""
+    labels, _ = _parent_options(tickets)
+    n = len(tickets)
+    rows = [None] * n
+    for i, ticket in enumerate(tickets):
+        parent_idx = ticket.get("parent_index")
+        rows[i] = {
+            "Type": ticket.get("type"),
+            "Summary": ticket.get("summary", ""),
+            "Description": ticket.get("description", ""),
+            "Parent": labels[parent_idx + 1] if parent_idx is not None and 0 <= parent_idx < n else "None",
+        }
+    return pd.DataFrame(rows, columns=["Type", "Summary", "Description", "Parent"])
+
+
 def pill_class(ticket_type: str) -> str:
-    normalized = (ticket_type or "").strip().lower()
-    if normalized == "epic":
-        return "pill-epic"
-    if normalized == "story":
-        return "pill-story"
-    if normalized == "subtask":
-        return "pill-subtask"
-    return "pill-task"
+    return _PILL.get((ticket_type or "").strip().lower(), "pill-task")
+
+
+@st.fragment
+def _render_tickets(tickets: List[Dict]):
+    """Preview and editor; applying edits reruns only this section."""
+    _render_preview(tickets)
+    _render_editor(tickets)
+
+
+def _render_preview(tickets: List[Dict]):
+    st.markdown("<div class='section-title'>Tickets Preview</div>", unsafe_allow_html=True)
+    # One element for all cards instead of one per ticket
+    st.markdown(_preview_html(tickets), unsafe_allow_html=True)
+    st.markdown("<div class='divider'></div>", unsafe_allow_html=True)
+    st.dataframe(_tickets_df(tickets), use_container_width=True, hide_index=True)
+
+
+def _render_editor(tickets: List[Dict]):
+    st.markdown("<div class='section-title'>Edit Tickets</div>", unsafe_allow_html=True)
+    labels, _ = _parent_options(tickets)
+    version = st.session_state.editor_version
+
+    # Picking a ticket only reruns this fragment; its criteria are edited in the form below
+    criteria_index = st.selectbox(
+        "Acceptance criteria for",
+        range(len(tickets)),
+        format_func=lambda i: labels[i + 1],
+        key="criteria_ticket",
+    )
+
+    # Edits are collected in a form so they cost one rerun when applied, not one per cell
+    editor_key = f"ticket_editor_{version}"
+    criteria_key = f"criteria_{version}_{criteria_index}"
+    with st.form("edit_tickets", clear_on_submit=False):
+        st.data_editor(
+            _editor_df(tickets),
+            key=editor_key,
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Type": st.column_config.SelectboxColumn("Type", options=_TYPES, required=True),
+                "Summary": st.column_config.TextColumn("Summary", required=True),
+                "Description": st.column_config.TextColumn("Description"),
+                "Parent": st.column_config.SelectboxColumn("Parent", options=labels),
+            },
+        )
+        if criteria_index is not None and criteria_index < len(tickets):
+            st.text_area(
+                "Acceptance Criteria (one per line)",
+                value="\n".join(tickets[criteria_index].get("acceptance_criteria", [])),
+                key=criteria_key,
+                height=120,
+            )
+        # The callback runs before the rerun, so the preview already shows the edits
+        st.form_submit_button(
+            "Apply edits",
+            on_click=_apply_edits,
+            args=(tickets, editor_key, criteria_index, criteria_key),
+            disabled=st.session_state.creating,
+        )
+
+
+def _apply_edits(
+    tickets: List[Dict], editor_key: str, criteria_index: Optional[int], criteria_key: str
+):
+    """Copy submitted editor values from session_state into the tickets."""
+    # Parent labels were rendered from the tickets as they were before this edit
+    _, parent_mapping = _parent_options(tickets)
+    edited_rows = st.session_state.get(editor_key, {}).get("edited_rows", {})
+    for row, changes in edited_rows.items():
+        i = int(row)
+        ticket = tickets[i]
+        if changes.get("Type"):
+            ticket["type"] = changes["Type"]
+        if "Summary" in changes:
+            ticket["summary"] = changes["Summary"] or ""
+        if "Description" in changes:
+            ticket["description"] = changes["Description"] or ""
+        if "Parent" in changes:
+            parent_index = parent_mapping.get(changes["Parent"])
+            # A ticket cannot be its own parent; keep the previous value
+            if parent_index != i:
+                ticket["parent_index"] = parent_index
+
+    if criteria_index is not None and criteria_index < len(tickets) and criteria_key in st.session_state:
+        tickets[criteria_index]["acceptance_criteria"] = [
+            c.strip() for c in st.session_state[criteria_key].splitlines() if c.strip()
+        ]
+    # Fresh widget keys so the applied edits are not replayed onto the updated table
+    st.session_state.editor_version += 1
 
 
 def main():
@@ -261,6 +355,9 @@ def main():
     if "create_errors" not in st.session_state:
         st.session_state.create_errors = []
 
+    if "editor_version" not in st.session_state:
+        st.session_state.editor_version = 0
+
     with st.sidebar:
         st.markdown("<div class='section-title'>Configuration</div>", unsafe_allow_html=True)
         with st.form("config_form", clear_on_submit=False):
@@ -271,6 +368,8 @@ def main():
             openai_api_key = st.text_input("OpenAI API Key", value=config.openai_api_key, type="password")
             persist = st.checkbox("Save to .env", value=False)
             submitted = st.form_submit_button("Apply Configuration", disabled=st.session_state.creating)
+            # Inside the form so typing credentials never reruns the app; tests the entered values
+            test_submitted = st.form_submit_button("Test Jira Connection", disabled=st.session_state.creating)
 
         if submitted:
             st.session_state.config = build_config_from_inputs(
@@ -278,17 +377,19 @@ def main():
             )
             st.success("Configuration applied for this session.")
 
-        config = st.session_state.config
-        if config.is_configured():
-            jira_client = JiraClient(config)
-            if st.button("Test Jira Connection", disabled=st.session_state.creating):
+        if test_submitted:
+            credentials = (jira_url.strip(), jira_email.strip(), jira_api_token.strip())
+            if all(credentials):
                 with st.spinner("Testing connection..."):
-                    ok = jira_client.test_connection()
+                    ok = get_jira_client(*credentials).test_connection()
                 if ok:
                     st.success("Connected to Jira.")
                 else:
                     st.error("Failed to connect to Jira. Check your credentials.")
-        else:
+            else:
+                st.error("Enter the Jira URL, email and API token to test the connection.")
+
+        if not st.session_state.config.is_configured():
             st.warning("Provide Jira credentials to continue.")
 
     config = st.session_state.config
@@ -296,22 +397,25 @@ def main():
         st.info("Set Jira and OpenAI credentials to unlock analysis and ticket creation.")
         return
 
-    jira_client = JiraClient(config)
-
     st.markdown("<div class='section-title'>Project</div>", unsafe_allow_html=True)
     project_col, refresh_col = st.columns([3, 1])
     with refresh_col:
         if st.button("Load Projects", disabled=st.session_state.creating):
             with st.spinner("Loading projects..."):
-                st.session_state.projects = jira_client.get_projects()
+                try:
+                    st.session_state.projects = _load_projects(
+                        config.jira_url, config.jira_email, config.jira_api_token
+                    )
+                except _EmptyResult:
+                    st.session_state.projects = []
 
     projects = st.session_state.projects
     if not projects:
         st.info("Load projects to choose a destination.")
         return
 
-    project_map = {f"{p['key']} - {p['name']}": p["key"] for p in projects}
-    selection = project_col.selectbox("Select Project", list(project_map.keys()))
+    labels, project_map = _project_options(projects)
+    selection = project_col.selectbox("Select Project", labels)
     project_key = project_map[selection]
 
     st.markdown("<div class='section-title'>Requirements</div>", unsafe_allow_html=True)
@@ -336,9 +440,14 @@ def main():
                 st.error("Please provide requirements before analyzing.")
             else:
                 with st.spinner("Analyzing requirements with AI..."):
-                    analyzer = LLMAnalyzer(config)
-                    st.session_state.tickets = analyzer.analyze_requirements(requirements)
+                    from jira_automation.llm_analyzer import PROMPT_VERSION
+
+                    try:
+                        st.session_state.tickets = _analyze(requirements.strip(), config, PROMPT_VERSION)
+                    except _EmptyResult:
+                        st.session_state.tickets = []
                 st.session_state.last_requirements = requirements.strip()
+                st.session_state.editor_version += 1
                 st.session_state.created = False
                 st.session_state.created_tickets = []
                 st.session_state.create_errors = []
@@ -359,55 +468,7 @@ def main():
     if not tickets:
         return
 
-    st.markdown("<div class='section-title'>Tickets Preview</div>", unsafe_allow_html=True)
-    for ticket in tickets:
-        st.markdown(
-            f"<div class='card'><span class='ticket-pill {pill_class(ticket.get('type', ''))}'>"
-            f"{ticket.get('type')}</span><strong>{ticket.get('summary')}</strong>"
-            f"<div class='subtle'>{ticket.get('description', '')[:140]}</div></div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("<div class='divider'></div>", unsafe_allow_html=True)
-    st.dataframe(tickets_table(tickets), use_container_width=True, hide_index=True)
-
-    st.markdown("<div class='section-title'>Edit Tickets</div>", unsafe_allow_html=True)
-    for i, ticket in enumerate(tickets):
-        with st.expander(describe_ticket(ticket, tickets), expanded=False):
-            ticket["type"] = st.selectbox(
-                "Type",
-                ["Epic", "Story", "Task", "Subtask"],
-                index=["Epic", "Story", "Task", "Subtask"].index(ticket.get("type", "Task")),
-                key=f"type_{i}",
-            )
-            ticket["summary"] = st.text_input(
-                "Summary", value=ticket.get("summary", ""), key=f"summary_{i}"
-            )
-            ticket["description"] = st.text_area(
-                "Description",
-                value=ticket.get("description", ""),
-                key=f"description_{i}",
-                height=140,
-            )
-            criteria_text = "\n".join(ticket.get("acceptance_criteria", []))
-            criteria_text = st.text_area(
-                "Acceptance Criteria (one per line)",
-                value=criteria_text,
-                key=f"criteria_{i}",
-                height=120,
-            )
-            ticket["acceptance_criteria"] = [c.strip() for c in criteria_text.splitlines() if c.strip()]
-
-            options = build_parent_options(i, tickets)
-            current_parent = ticket.get("parent_index")
-            current_label = next((label for label, idx in options if idx == current_parent), "None")
-            parent_label = st.selectbox(
-                "Parent Ticket",
-                [label for label, _ in options],
-                index=[label for label, _ in options].index(current_label),
-                key=f"parent_{i}",
-            )
-            selected_idx = next(idx for label, idx in options if label == parent_label)
-            ticket["parent_index"] = selected_idx
+    _render_tickets(tickets)
 
     st.markdown("<div class='section-title'>Create in Jira</div>", unsafe_allow_html=True)
     confirm = st.checkbox(
@@ -426,9 +487,7 @@ def main():
         if st.button("Create Tickets", disabled=create_disabled):
             st.session_state.creating = True
             with st.spinner("Creating tickets in Jira..."):
-                app = JiraAutomationApp()
-                app.jira_client = jira_client
-                app.ui = SilentUI()
+                app = _automation_app(config.jira_url, config.jira_email, config.jira_api_token)
                 created, errors = app.create_tickets(project_key, tickets)
             st.session_state.creating = False
             st.session_state.created = True
@@ -438,7 +497,7 @@ def main():
     if st.session_state.created_tickets:
         st.success(f"Created {len(st.session_state.created_tickets)} tickets in Jira.")
         st.dataframe(
-            st.session_state.created_tickets,
+            _created_df(st.session_state.created_tickets),
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -0,0 +1,74 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from jira_automation.config import Config
+
+
+class TestConfigFile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self._tmp.name)
+        patcher = patch("jira_automation.config.Path.home", return_value=self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+        env = patch.dict("os.environ", {"JIRA_URL": ""})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_save_and_load_roundtrip(self):
+        Config().save_config("https://example.atlassian.net")
+
+        self.assertEqual(Config().jira_url, "https://example.atlassian.net")
+
+    def test_legacy_yaml_is_migrated_to_json(self):
+        config_dir = self.home / ".jira-automation"
+        config_dir.mkdir()
+        (config_dir / "config.yaml").write_text("jira:\n  url: https://legacy.atlassian.net\n")
+
+        config = Config()
+
+        self.assertEqual(config.jira_url, "https://legacy.atlassian.net")
+        self.assertFalse((config_dir / "config.yaml").exists())
+        data = json.loads((config_dir / "config.json").read_text())
+        self.assertEqual(data, {"jira": {"url": "https://legacy.atlassian.net"}})
+
+    def test_llm_check_follows_reset_after_key_update(self):
+        with patch.dict("os.environ", {"OPENAI_API_KEY": ""}):
+            config = Config()
+        self.assertFalse(config.is_llm_configured())
+
+        config.openai_api_key = "sk-test"
+        config.reset_checks()
+
+        self.assertTrue(config.is_llm_configured())
+
+    def test_epic_link_field_id_is_loaded_for_the_same_url(self):
+        Config(jira_url="https://example.atlassian.net").save_epic_link_field_id("customfield_10014")
+
+        config = Config(jira_url="https://example.atlassian.net")
+
+        self.assertEqual(config.jira_epic_link_field_id, "customfield_10014")
+        self.assertGreater(config.jira_epic_link_cached_at, 0)
+
+    def test_epic_link_field_id_is_ignored_for_another_url(self):
+        Config(jira_url="https://example.atlassian.net").save_epic_link_field_id("customfield_10014")
+
+        config = Config(jira_url="https://other.atlassian.net")
+
+        self.assertIsNone(config.jira_epic_link_field_id)
+        self.assertEqual(config.jira_epic_link_cached_at, 0.0)
+
+    def test_missing_epic_link_field_is_saved_as_empty_string(self):
+        Config(jira_url="https://example.atlassian.net").save_epic_link_field_id(None)
+
+        config = Config(jira_url="https://example.atlassian.net")
+
+        self.assertEqual(config.jira_epic_link_field_id, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
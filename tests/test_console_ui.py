@@ -17,8 +17,16 @@ class TestConsoleUIRequirements(unittest.TestCase):
                 raise EOFError()
 
         with patch("builtins.input", side_effect=fake_input), patch(
-            "sys.stdout", new_callable=io.StringIO
-        ):
+            "sys.stdin"
+        ) as stdin, patch("sys.stdout", new_callable=io.StringIO):
+            stdin.isatty.return_value = True
+            return ui.get_requirements()
+
+    def _run_get_requirements_piped(self, stdin):
+        ui = ConsoleUI()
+        with patch("builtins.input", side_effect=AssertionError("input() called")), patch(
+            "sys.stdin", stdin
+        ), patch("sys.stdout", new_callable=io.StringIO):
             return ui.get_requirements()
 
     def test_allows_single_empty_line_in_content(self):
@@ -33,6 +41,22 @@ class TestConsoleUIRequirements(unittest.TestCase):
         result = self._run_get_requirements(["", ""])
         self.assertEqual(result, "")
 
+    def test_piped_input_leaves_remaining_lines_unread(self):
+        stdin = io.StringIO("line one\n\nline two\n/done\nnext answer\n")
+        result = self._run_get_requirements_piped(stdin)
+        self.assertEqual(result, "line one\nline two")
+        self.assertEqual(stdin.read(), "next answer\n")
+
+    def test_piped_input_stops_at_two_empty_lines(self):
+        stdin = io.StringIO("update backend\n\n\nnext answer\n")
+        result = self._run_get_requirements_piped(stdin)
+        self.assertEqual(result, "update backend")
+        self.assertEqual(stdin.read(), "next answer\n")
+
+    def test_piped_input_ends_at_eof(self):
+        result = self._run_get_requirements_piped(io.StringIO("update backend\n"))
+        self.assertEqual(result, "update backend")
+
 
 if __name__ == "__main__":
     unittest.main()
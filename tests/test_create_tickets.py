@@ -74,6 +74,39 @@ class TestCreateTickets(unittest.TestCase):
             epic_key="KAN-30",
         )
 
+    def test_acceptance_criteria_appended_to_description(self):
+        tickets = [
+            {"index": 0, "type": "Story", "summary": "Story A", "description": "Do it", "acceptance_criteria": ["One", "Two"], "parent_index": None},
+        ]
+        self.app.jira_client.create_issue.return_value = {"key": "KAN-20"}
+
+        self.app.create_tickets("KAN", tickets)
+
+        description = self.app.jira_client.create_issue.call_args.kwargs["description"]
+        self.assertEqual(description, "Do it\n\nAcceptance Criteria:\n• One\n• Two\n")
+
+    def test_concurrent_creation_batches_siblings_after_parent(self):
+        self.app.concurrency = 4
+        tickets = [
+            {"index": 0, "type": "Epic", "summary": "Epic A", "description": "", "acceptance_criteria": [], "parent_index": None},
+            {"index": 1, "type": "Story", "summary": "Story A", "description": "", "acceptance_criteria": [], "parent_index": 0},
+            {"index": 2, "type": "Story", "summary": "Story B", "description": "", "acceptance_criteria": [], "parent_index": 0},
+        ]
+        self.app.jira_client.create_issue.return_value = {"key": "KAN-40"}
+        self.app.jira_client.create_issues_bulk.return_value = [{"key": "KAN-41"}, None]
+
+        created, errors = self.app.create_tickets("KAN", tickets)
+
+        self.assertEqual([t["key"] for t in created], ["KAN-40", "KAN-41"])
+        self.assertEqual(errors, ["Failed to create: Story B"])
+        self.app.jira_client.create_issue.assert_called_once()
+        story_batch = self.app.jira_client.create_issues_bulk.call_args
+        self.assertEqual(
+            [(p["summary"], p["epic_key"]) for p in story_batch.args[0]],
+            [("Story A", "KAN-40"), ("Story B", "KAN-40")],
+        )
+        self.assertEqual(story_batch.kwargs, {"max_workers": 4})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+import requests
+
+from jira_automation.jira_client import EPIC_LINK_CACHE_TTL, JiraClient
+
+
+def _issue(summary):
+    return {"project_key": "KAN", "issue_type": "Story", "summary": summary, "description": ""}
+
+
+class TestCreateIssuesBulk(unittest.TestCase):
+    def setUp(self):
+        config = Mock()
+        config.jira_url = "https://example.atlassian.net"
+        config.get_auth_headers.return_value = {}
+        self.client = JiraClient(config)
+        self.client._session = Mock()
+
+    def test_results_follow_input_order_around_failures(self):
+        response = Mock(status_code=201)
+        response.json.return_value = {
+            "issues": [{"key": "KAN-1"}, {"key": "KAN-3"}],
+            "errors": [{"failedElementNumber": 1, "elementErrors": {"errors": {"summary": "bad"}}}],
+        }
+        self.client._session.post.return_value = response
+
+        results = self.client.create_issues_bulk([_issue("A"), _issue("B"), _issue("C")])
+
+        self.assertEqual(results, [{"key": "KAN-1"}, None, {"key": "KAN-3"}])
+        url = self.client._session.post.call_args.args[0]
+        payload = self.client._session.post.call_args.kwargs["json"]
+        self.assertTrue(url.endswith("/rest/api/3/issue/bulk"))
+        self.assertEqual(len(payload["issueUpdates"]), 3)
+
+    def test_falls_back_to_single_creates_when_bulk_unavailable(self):
+        not_found = Mock(status_code=404)
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+        created = Mock(status_code=201)
+        created.json.return_value = {"key": "KAN-7"}
+        self.client._session.post.side_effect = [not_found, created]
+
+        results = self.client.create_issues_bulk([_issue("A")])
+
+        self.assertEqual(results, [{"key": "KAN-7"}])
+        self.assertTrue(self.client._session.post.call_args.args[0].endswith("/rest/api/3/issue"))
+
+    def test_timeout_does_not_fall_back_to_single_creates(self):
+        self.client._session.post.side_effect = requests.exceptions.ReadTimeout("timed out")
+
+        results = self.client.create_issues_bulk([_issue("A"), _issue("B")])
+
+        self.assertEqual(results, [None, None])
+        self.assertEqual(self.client._session.post.call_count, 1)
+
+
+class TestEpicLinkFieldId(unittest.TestCase):
+    def setUp(self):
+        self.config = Mock()
+        self.config.jira_url = "https://example.atlassian.net"
+        self.config.get_auth_headers.return_value = {}
+        self.config.jira_epic_link_field_id = None
+        self.config.jira_epic_link_cached_at = 0.0
+        self.client = JiraClient(self.config)
+        self.client._session = Mock()
+
+    def _fields_response(self, payload, ok=True):
+        response = Mock(ok=ok)
+        response.json.return_value = payload
+        return response
+
+    def test_fresh_persisted_id_skips_the_field_lookup(self):
+        self.config.jira_epic_link_field_id = "customfield_10014"
+        self.config.jira_epic_link_cached_at = time.time()
+
+        self.assertEqual(self.client._get_epic_link_field_id(), "customfield_10014")
+        self.client._session.get.assert_not_called()
+
+    def test_persisted_empty_id_means_no_field(self):
+        self.config.jira_epic_link_field_id = ""
+        self.config.jira_epic_link_cached_at = time.time()
+
+        self.assertIsNone(self.client._get_epic_link_field_id())
+        self.client._session.get.assert_not_called()
+
+    def test_expired_persisted_id_is_fetched_again(self):
+        self.config.jira_epic_link_field_id = "customfield_10014"
+        self.config.jira_epic_link_cached_at = time.time() - EPIC_LINK_CACHE_TTL - 1
+        self.client._session.get.return_value = self._fields_response(
+            {"values": [{"id": "customfield_10020", "name": "Epic Link"}]}
+        )
+
+        self.assertEqual(self.client._get_epic_link_field_id(), "customfield_10020")
+        url = self.client._session.get.call_args.args[0]
+        self.assertTrue(url.endswith("/rest/api/3/field/search"))
+        self.config.save_epic_link_field_id.assert_called_once_with("customfield_10020")
+
+    def test_falls_back_to_full_field_listing(self):
+        self.client._session.get.side_effect = [
+            self._fields_response({}, ok=False),
+            self._fields_response([{"id": "customfield_10014", "name": "Epic Link"}]),
+        ]
+
+        self.assertEqual(self.client._get_epic_link_field_id(), "customfield_10014")
+        url = self.client._session.get.call_args.args[0]
+        self.assertTrue(url.endswith("/rest/api/3/field"))
+
+    def test_missing_field_is_persisted_as_empty_string(self):
+        self.client._session.get.return_value = self._fields_response(
+            {"values": [{"id": "customfield_10001", "name": "Team"}]}
+        )
+
+        self.assertIsNone(self.client._get_epic_link_field_id())
+        self.config.save_epic_link_field_id.assert_called_once_with("")
+        self.assertIsNone(self.client._get_epic_link_field_id())
+        self.assertEqual(self.client._session.get.call_count, 1)
+
+    def test_persist_failure_is_logged(self):
+        self.client._session.get.return_value = self._fields_response(
+            {"values": [{"id": "customfield_10014", "name": "Epic Link"}]}
+        )
+        self.config.save_epic_link_field_id.side_effect = OSError("read-only")
+
+        with self.assertLogs("jira_automation.jira_client", level="WARNING") as logs:
+            self.assertEqual(self.client._get_epic_link_field_id(), "customfield_10014")
+        self.assertIn("Could not persist Epic Link field id", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import unittest
+from unittest.mock import Mock
+
+from jira_automation.llm_analyzer import LLMAnalyzer
+
+
+def _completion(payload):
+    message = Mock(content=json.dumps(payload))
+    return Mock(choices=[Mock(message=message)])
+
+
+def _email(subject):
+    return {"subject": subject, "from": "client@example.com", "body": f"Body of {subject}"}
+
+
+class TestExtractTasksFromEmails(unittest.TestCase):
+    def setUp(self):
+        config = Mock()
+        config.openai_api_key = "sk-test"
+        self.analyzer = LLMAnalyzer(config)
+        self.analyzer.client = Mock()
+        self.create = self.analyzer.client.chat.completions.create
+
+    def test_results_are_aligned_with_input_across_batches(self):
+        self.create.side_effect = [
+            _completion({"tasks": [
+                {"idx": 1, "summary": "Second", "description": "two"},
+                {"idx": 0, "summary": "First", "description": "one", "is_website_requirement": "yes"},
+            ]}),
+            _completion({"tasks": [{"idx": 2, "summary": "Third", "description": "three"}]}),
+        ]
+
+        tasks = self.analyzer.extract_tasks_from_emails(
+            [_email("A"), _email("B"), _email("C")], batch_size=2
+        )
+
+        self.assertEqual([task["summary"] for task in tasks], ["First", "Second", "Third"])
+        self.assertTrue(tasks[0]["is_website_requirement"])
+        self.assertFalse(tasks[1]["is_website_requirement"])
+        self.assertEqual(self.create.call_count, 2)
+
+    def test_missing_and_out_of_batch_idx_leave_none(self):
+        self.create.return_value = _completion({"tasks": [
+            {"idx": 0, "summary": "First"},
+            {"idx": 5, "summary": "Unknown"},
+            {"summary": "No idx"},
+        ]})
+
+        tasks = self.analyzer.extract_tasks_from_emails([_email("A"), _email("B")])
+
+        self.assertEqual(tasks[0]["summary"], "First")
+        self.assertEqual(tasks[0]["description"], "Body of A")
+        self.assertIsNone(tasks[1])
+
+    def test_failed_batch_gives_none_entries(self):
+        self.create.side_effect = [
+            RuntimeError("rate limited"),
+            _completion({"tasks": [{"idx": 2, "summary": "Third"}]}),
+        ]
+
+        tasks = self.analyzer.extract_tasks_from_emails(
+            [_email("A"), _email("B"), _email("C")], batch_size=2
+        )
+
+        self.assertEqual(tasks[:2], [None, None])
+        self.assertEqual(tasks[2]["summary"], "Third")
+
+
+if __name__ == "__main__":
+    unittest.main()
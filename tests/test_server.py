@@ -0,0 +1,49 @@
+import unittest
+
+from server import EmailBody, EmailPayload
+
+
+class TestEmailPayload(unittest.TestCase):
+    def test_plain_body_is_preferred_over_html(self):
+        payload = EmailPayload.model_validate_json(
+            '{"subject": "Hi", "from": "a@example.com", "body": {"plain": " please ", "html": "<b>h</b>"}}'
+        )
+
+        self.assertEqual(payload.from_, "a@example.com")
+        self.assertEqual(payload.body_text, "please")
+
+    def test_html_body_is_used_when_plain_is_null(self):
+        payload = EmailPayload.model_validate_json('{"body": {"plain": null, "html": "<b>h</b>"}}')
+
+        self.assertEqual(payload.body_text, "<b>h</b>")
+
+    def test_string_and_number_bodies_are_kept_as_text(self):
+        self.assertEqual(EmailPayload.model_validate_json('{"body": "raw text"}').body_text, "raw text")
+        self.assertEqual(EmailPayload.model_validate_json('{"body": 123}').body_text, "123")
+
+    def test_dict_body_without_content_is_stringified(self):
+        payload = EmailPayload.model_validate_json('{"body": {"text": "hello"}}')
+
+        self.assertEqual(payload.body_text, "{'text': 'hello'}")
+
+    def test_missing_fields_default_to_empty(self):
+        payload = EmailPayload.model_validate_json('{"subject": null, "body": null, "message_id": 5}')
+
+        self.assertEqual(payload.subject, "")
+        self.assertEqual(payload.body_text, "")
+        self.assertEqual(payload.message_id, "5")
+
+    def test_non_string_body_parts_are_coerced_to_text(self):
+        payload = EmailPayload.model_validate_json('{"body": {"plain": "x", "html": 5}}')
+
+        self.assertEqual(payload.body_text, "x")
+        self.assertEqual(payload.body.html, "5")
+
+    def test_email_body_treats_null_parts_as_empty(self):
+        body = EmailBody.model_validate_json('{"plain": null}')
+
+        self.assertEqual((body.plain, body.html), ("", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()